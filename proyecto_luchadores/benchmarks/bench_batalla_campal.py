@@ -0,0 +1,54 @@
+# ==============================================================
+#  benchmarks/bench_batalla_campal.py
+# ==============================================================
+#  Mide los turnos por segundo de batalla_campal.pelear_campal
+#  con cantidades crecientes de luchadores y cada política de
+#  objetivo. Con el orden de turnos y la elección de objetivos en
+#  montículos, el coste por turno crece como O(log N), así que el
+#  rendimiento debería mantenerse casi constante al crecer N.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m benchmarks.bench_batalla_campal --luchadores 100 1000 10000
+# ==============================================================
+
+import argparse
+import time
+
+from benchmarks.generador import generar_programa
+from parser_pkg.batalla_campal import POLITICAS, guiones_campal, pelear_campal
+from parser_pkg.interprete import analizar
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--luchadores", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--rondas", type=int, default=50)
+    args = parser.parse_args()
+
+    for n in args.luchadores:
+        nombres = [f"Luchador{i}" for i in range(n)]
+        texto = generar_programa(n, turnos_max=args.rondas).replace(
+            "luchadores: Luchador0 vs Luchador1;", f"luchadores: {' vs '.join(nombres)};")
+        programa, _ = analizar(texto)
+        config = programa.simulacion.config
+        guiones = guiones_campal(programa)
+
+        for politica in POLITICAS:
+            turnos = 0
+
+            def contar(mensaje):
+                nonlocal turnos
+                if mensaje.startswith("  Turno"):
+                    turnos += 1
+
+            luchadores = [programa.luchadores[nombre].clonar() for nombre in nombres]
+            inicio = time.perf_counter()
+            r = pelear_campal(luchadores, guiones, config.inicia, config.turnos,
+                              politica, log=contar)
+            duracion = time.perf_counter() - inicio
+            print(f"  {n:>6} luchadores {politica:<9} {turnos:>9,} turnos "
+                  f"{len(r.eliminados):>6} eliminados {turnos / duracion:12,.0f} turnos/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# ==============================================================
+#  benchmarks/bench_parseo_paralelo.py
+# ==============================================================
+#  Mide MB/s al analizar una biblioteca grande con el parser
+#  secuencial y con parseo_paralelo para distintas cantidades de
+#  procesos, y comprueba que ambos producen el mismo programa.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m benchmarks.bench_parseo_paralelo --luchadores 50000
+# ==============================================================
+
+import argparse
+import os
+import time
+
+from benchmarks.generador import generar_programa
+from parser_pkg.formateador import formatear_programa
+from parser_pkg.interprete import analizar
+from parser_pkg.parseo_paralelo import analizar_paralelo
+
+
+def medir(nombre, funcion, texto):
+    inicio = time.perf_counter()
+    programa, diagnosticos = funcion(texto)
+    duracion = time.perf_counter() - inicio
+    print(f"  {nombre:<14} {len(texto) / 1e6 / duracion:6.2f} MB/s ({duracion:.2f} s)")
+    return programa, diagnosticos
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--luchadores", type=int, default=50000)
+    parser.add_argument("-j", "--procesos", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    texto = generar_programa(args.luchadores)
+    print(f"{args.luchadores} luchadores, {len(texto) / 1e6:.1f} MB")
+    secuencial, _ = medir("secuencial", analizar, texto)
+    esperado = formatear_programa(secuencial)
+
+    procesos = 2
+    while procesos <= args.procesos:
+        programa, _ = medir(f"procesos={procesos}",
+                            lambda t: analizar_paralelo(t, procesos), texto)
+        assert formatear_programa(programa) == esperado
+        procesos *= 2
+
+
+if __name__ == "__main__":
+    main()
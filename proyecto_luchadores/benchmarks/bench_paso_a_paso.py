@@ -0,0 +1,58 @@
+# ==============================================================
+#  benchmarks/bench_paso_a_paso.py
+# ==============================================================
+#  Mide cuánto cuesta ramificar un combate a mitad de camino:
+#  restaurar una foto de PeleaPasoAPaso y avanzar un paso, frente
+#  a clonar los luchadores y repetir el combate desde el inicio
+#  con motor_combate.pelear hasta el mismo punto.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m benchmarks.bench_paso_a_paso --ramas 1000000
+# ==============================================================
+
+import argparse
+import time
+
+from benchmarks.generador import generar_programa
+from parser_pkg.interprete import analizar
+from parser_pkg.motor_combate import guion_de, pelear
+from parser_pkg.paso_a_paso import PeleaPasoAPaso
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ramas", type=int, default=1000000)
+    args = parser.parse_args()
+
+    programa, _ = analizar(generar_programa(2, turnos_max=20))
+    pelea = PeleaPasoAPaso.desde_programa(programa, "Luchador0", "Luchador1")
+    pelea.turno()
+    pelea.turno()
+    foto = pelea.snapshot()
+    ronda = pelea.ronda
+
+    inicio = time.perf_counter()
+    for _ in range(args.ramas):
+        pelea.restore(foto)
+        pelea.paso()
+    duracion = time.perf_counter() - inicio
+    print(f"  snapshot/restore + paso: {args.ramas / duracion:12,.0f} ramas/s")
+
+    inicio = time.perf_counter()
+    for _ in range(args.ramas):
+        foto = pelea.snapshot()
+    duracion = time.perf_counter() - inicio
+    print(f"  solo snapshot:           {args.ramas / duracion:12,.0f} fotos/s")
+
+    l1, l2 = (programa.luchadores[n] for n in ("Luchador0", "Luchador1"))
+    turnos = {n: guion_de(programa, n) for n in ("Luchador0", "Luchador1")}
+    repeticiones = max(1, args.ramas // 10)
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        pelear(l1.clonar(), l2.clonar(), turnos, "Luchador0", ronda + 1)
+    duracion = time.perf_counter() - inicio
+    print(f"  clonar + repetir:        {repeticiones / duracion:12,.0f} ramas/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# ==============================================================
+#  benchmarks/bench_ranking.py
+# ==============================================================
+#  Compara la clasificación adaptativa (ranking.clasificar) con
+#  el torneo todos contra todos: combates simulados, tiempo y
+#  parecido de la clasificación obtenida (Spearman y cuántos del
+#  top 10 coinciden).
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m benchmarks.bench_ranking --luchadores 1000
+# ==============================================================
+
+import argparse
+import os
+import time
+
+from benchmarks.generador import generar_programa
+from parser_pkg.parseo_paralelo import analizar_paralelo
+from parser_pkg.ranking import clasificar, puntuacion, spearman
+from parser_pkg.roster_compartido import RosterCompartido, simular_pares
+
+
+def todos_contra_todos(programa, roster, procesos):
+    """Clasificación por puntos (1 victoria, 0.5 empate) del torneo completo."""
+    n = len(programa.luchadores)
+    pares = [(i, j) for i in range(n) for j in range(n) if i != j]
+    resultados = simular_pares(roster, pares, programa.simulacion.config.turnos, procesos)
+    puntos = [0.0] * n
+    for (i, j), (hp_i, _, hp_j, _, _) in zip(pares, resultados):
+        s = puntuacion(hp_i, hp_j)
+        puntos[i] += s
+        puntos[j] += 1 - s
+    return sorted(range(n), key=lambda k: (-puntos[k], k)), len(pares)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--luchadores", type=int, default=1000)
+    parser.add_argument("-j", "--procesos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--confianza", type=float, default=0.995)
+    args = parser.parse_args()
+
+    programa, _ = analizar_paralelo(generar_programa(args.luchadores), args.procesos)
+    nombres = list(programa.luchadores)
+    indices = {nombre: k for k, nombre in enumerate(nombres)}
+    roster = RosterCompartido.crear(programa)
+    print(f"{args.luchadores} luchadores, {args.procesos} procesos")
+
+    inicio = time.perf_counter()
+    referencia, total = todos_contra_todos(programa, roster, args.procesos)
+    duracion = time.perf_counter() - inicio
+    print(f"  todos contra todos: {total:>9} combates {duracion:7.2f} s")
+
+    inicio = time.perf_counter()
+    clasificacion, combates = clasificar(programa, args.procesos, args.confianza,
+                                         roster=roster)
+    duracion = time.perf_counter() - inicio
+    orden = [indices[nombre] for nombre, _, _ in clasificacion]
+    coinciden = len(set(orden[:10]) & set(referencia[:10]))
+    print(f"  suizo + Glicko:     {combates:>9} combates {duracion:7.2f} s "
+          f"spearman={spearman(referencia, orden):.4f} top10={coinciden}/10")
+    roster.liberar()
+
+
+if __name__ == "__main__":
+    main()
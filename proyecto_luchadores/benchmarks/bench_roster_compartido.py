@@ -0,0 +1,88 @@
+# ==============================================================
+#  benchmarks/bench_roster_compartido.py
+# ==============================================================
+#  Compara simular combates en un pool de procesos enviando la
+#  biblioteca serializada (pickle de objetos Luchador) contra
+#  adjuntarse al bloque de memoria compartida de RosterCompartido.
+#  Ambos usan procesos "spawn" para que el coste de enviar la
+#  biblioteca a cada trabajador sea visible (con fork se oculta
+#  en la copia del proceso padre).
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m benchmarks.bench_roster_compartido --luchadores 100000
+# ==============================================================
+
+import argparse
+import multiprocessing
+import os
+import pickle
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from parser_pkg.gramatica import (AccionAtomica, Combo, Configuracion, Luchador,
+                                  Programa, Simulacion)
+from parser_pkg.roster_compartido import RosterCompartido, simular_pares
+from parser_pkg.almacen_resultados import _preparar, _simular_lote
+
+
+def crear_programa(n, semilla=0):
+    """Biblioteca aleatoria construida directamente como objetos (sin parsear)."""
+    azar = random.Random(semilla)
+    luchadores = {}
+    for i in range(n):
+        l = Luchador(f"Luchador{i}", azar.randint(60, 200), azar.randint(40, 160))
+        l.acciones["puño"] = AccionAtomica("golpe", "puño", azar.randint(5, 20), azar.randint(3, 12))
+        l.acciones["patada_baja"] = AccionAtomica("patada", "patada_baja",
+                                                  azar.randint(5, 20), azar.randint(3, 12))
+        l.combos["Especial"] = Combo("Especial", azar.randint(10, 40), ["puño", "patada_baja"])
+        luchadores[l.nombre] = l
+    config = Configuracion("Luchador0", "Luchador1", "Luchador0", 10)
+    return Programa(luchadores, Simulacion(config, []))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--luchadores", type=int, default=100000)
+    parser.add_argument("--combates", type=int, default=20000)
+    parser.add_argument("-j", "--procesos", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    programa = crear_programa(args.luchadores)
+    azar = random.Random(1)
+    n = args.luchadores
+    pares = []
+    while len(pares) < args.combates:
+        i, j = azar.randrange(n), azar.randrange(n)
+        if i != j:
+            pares.append((i, j))
+    nombres = list(programa.luchadores)
+    turnos_max = programa.simulacion.config.turnos
+    print(f"{n} luchadores, {len(pares)} combates, {args.procesos} procesos")
+    contexto = multiprocessing.get_context("spawn")
+
+    # Biblioteca serializada a cada trabajador
+    inicio = time.perf_counter()
+    tam_pickle = len(pickle.dumps(programa))
+    with ProcessPoolExecutor(max_workers=args.procesos, mp_context=contexto,
+                             initializer=_preparar,
+                             initargs=(programa,)) as pool:
+        lotes = [[(nombres[i], nombres[j]) for i, j in pares[k:k + 4096]]
+                 for k in range(0, len(pares), 4096)]
+        list(pool.map(_simular_lote, lotes))
+    print(f"  pickle de objetos:   {time.perf_counter() - inicio:6.2f} s "
+          f"({tam_pickle / 1e6:.1f} MB por trabajador)")
+
+    # Memoria compartida
+    inicio = time.perf_counter()
+    roster = RosterCompartido.crear(programa)
+    codificado = time.perf_counter() - inicio
+    simular_pares(roster, pares, turnos_max, procesos=args.procesos, mp_context=contexto)
+    total = time.perf_counter() - inicio
+    print(f"  memoria compartida:  {total:6.2f} s "
+          f"(codificación {codificado:.2f} s, bloque de {roster.memoria.size / 1e6:.1f} MB)")
+    roster.liberar()
+
+
+if __name__ == "__main__":
+    main()
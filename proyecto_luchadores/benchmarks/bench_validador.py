@@ -0,0 +1,58 @@
+# ==============================================================
+#  benchmarks/bench_validador.py
+# ==============================================================
+#  Mide archivos/segundo del validador masivo con un proceso y
+#  con el pool de procesos.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m benchmarks.bench_validador --archivos 2000
+# ==============================================================
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.generador import generar_programa, introducir_errores
+from parser_pkg.validador import validar_archivos
+
+
+def crear_corpus(carpeta, n_archivos, luchadores_por_archivo):
+    azar = random.Random(1)
+    rutas = []
+    for i in range(n_archivos):
+        texto = generar_programa(luchadores_por_archivo, semilla=i)
+        if i % 4 == 0:
+            texto = introducir_errores(texto, azar)
+        ruta = Path(carpeta) / f"archivo_{i}.txt"
+        ruta.write_text(texto, encoding="utf-8")
+        rutas.append(ruta)
+    return rutas
+
+
+def medir(rutas, procesos):
+    inicio = time.perf_counter()
+    resultados = validar_archivos(rutas, procesos=procesos)
+    duracion = time.perf_counter() - inicio
+    errores = sum(len(d) for _, d in resultados)
+    print(f"  procesos={procesos:<3} {len(rutas) / duracion:8.0f} archivos/s "
+          f"({duracion:.2f} s, {errores} errores)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--archivos", type=int, default=2000)
+    parser.add_argument("--luchadores", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        rutas = crear_corpus(carpeta, args.archivos, args.luchadores)
+        print(f"Validando {len(rutas)} archivos de {args.luchadores} luchadores")
+        medir(rutas, 1)
+        medir(rutas, os.cpu_count() or 1)
+
+
+if __name__ == "__main__":
+    main()
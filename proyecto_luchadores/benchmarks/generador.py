@@ -0,0 +1,87 @@
+# ==============================================================
+#  benchmarks/generador.py
+# ==============================================================
+#  GENERADOR DE BIBLIOTECAS SINTÉTICAS
+# --------------------------------------------------------------
+#  Produce código fuente válido del lenguaje de luchadores con
+#  estadísticas pseudoaleatorias (reproducibles con una semilla)
+#  para medir el rendimiento de las herramientas con corpus
+#  grandes.
+# ==============================================================
+
+import random
+
+
+def generar_luchador(nombre, azar):
+    """Devuelve el código de un luchador con valores aleatorios."""
+    hp = azar.randint(60, 200)
+    st = azar.randint(40, 160)
+    golpe = (azar.randint(5, 20), azar.randint(3, 12))
+    patada = (azar.randint(5, 20), azar.randint(3, 12))
+    st_req = azar.randint(10, 40)
+    return (
+        f"luchador {nombre} {{\n"
+        f"  stats(hp={hp}, st={st});\n"
+        f"  acciones {{\n"
+        f"    golpe: puño(daño={golpe[0]}, costo={golpe[1]}, altura=media, forma=frontal, giratoria=no);\n"
+        f"    patada: patada_baja(daño={patada[0]}, costo={patada[1]}, altura=baja, forma=lateral, giratoria=si);\n"
+        f"    bloqueo: bloqueo_{nombre.lower()};\n"
+        f"  }}\n"
+        f"  combos {{\n"
+        f"    Especial(st_req={st_req}) {{ puño, patada_baja }}\n"
+        f"  }}\n"
+        f"}}\n\n"
+    )
+
+
+def generar_programa(n_luchadores, semilla=0, turnos_max=10):
+    """
+    Genera un programa completo con `n_luchadores` luchadores
+    (Luchador0, Luchador1, ...) y una simulación entre los dos primeros.
+    """
+    azar = random.Random(semilla)
+    partes = [generar_luchador(f"Luchador{i}", azar) for i in range(n_luchadores)]
+    partes.append(
+        "simulacion {\n"
+        "  config {\n"
+        "    luchadores: Luchador0 vs Luchador1;\n"
+        "    inicia: Luchador0;\n"
+        f"    turnos_max: {turnos_max};\n"
+        "  }\n"
+        "  pelea {\n"
+        "    turno Luchador0 {\n"
+        "      si (self.st > 30) { usa Especial; } sino { usa puño; }\n"
+        "    }\n"
+        "    turno Luchador1 {\n"
+        "      usa Especial;\n"
+        "    }\n"
+        "  }\n"
+        "}\n"
+    )
+    return "".join(partes)
+
+
+def introducir_errores(texto, azar, cantidad=2, antes_de_llave=False):
+    """
+    Estropea `cantidad` números del texto para provocar errores de sintaxis.
+    Con antes_de_llave=True cada error queda justo antes de una '}': se
+    quita el ';' de la última acción o instrucción de un bloque, o se
+    agrega un `usa` suelto antes de la '}' que cierra la línea (combos y
+    bloques si/sino).
+    """
+    lineas = texto.split("\n")
+    if antes_de_llave:
+        candidatas = [i for i in range(len(lineas) - 1)
+                      if (lineas[i].endswith(";") and lineas[i + 1].strip() == "}")
+                      or (lineas[i].endswith("}") and "{" in lineas[i])]
+    for _ in range(cantidad):
+        if not antes_de_llave:
+            i = azar.randrange(len(lineas))
+            lineas[i] = lineas[i].replace("=1", "=", 1).replace(";", "", 1)
+            continue
+        i = azar.choice(candidatas)
+        if lineas[i].endswith(";"):
+            lineas[i] = lineas[i][:-1]
+        else:
+            lineas[i] = lineas[i][:-1] + "usa }"
+    return "\n".join(lineas)
@@ -14,6 +14,8 @@
 #   - Ignorar espacios, saltos de línea y comentarios
 # ==============================================================
 
+import sys
+
 import ply.lex as lex
 
 # --------------------------------------------------------------
@@ -110,6 +112,9 @@ def t_NUMERO(t):
 # Fuerza la prioridad de palabras reservadas sobre ID
 def t_ID(t):
     r'[A-Za-z_áéíóúÁÉÍÓÚñÑ][A-Za-z0-9_áéíóúÁÉÍÓÚñÑ]*'
+    # Los identificadores se repiten mucho entre luchadores (nombres
+    # de acciones y combos): se internan para compartir una sola cadena.
+    t.value = sys.intern(t.value)
     palabra = t.value.lower()
     if palabra == "vs":
         t.type = "VS"
@@ -132,9 +137,22 @@ def t_newline(t):
     t.lexer.lineno += len(t.value)
 
 def t_error(t):
-    print(f"  Caracter no permitido: '{t.value[0]}' en la línea {t.lexer.lineno}")
+    # Si el lexer tiene un recolector asociado (modo validación) el error
+    # se registra como diagnóstico en vez de imprimirse.
+    reportar = getattr(t.lexer, 'reportar', None)
+    if reportar is not None:
+        reportar('lexico', t.lexer.lineno, calcular_columna(t.lexer.lexdata, t.lexpos),
+                 f"Caracter no permitido: '{t.value[0]}'")
+    else:
+        print(f"  Caracter no permitido: '{t.value[0]}' en la línea {t.lexer.lineno}")
     t.lexer.skip(1)
 
+def calcular_columna(texto, posicion):
+    """
+    Devuelve la columna (desde 1) que ocupa `posicion` dentro de su línea.
+    """
+    return posicion - texto.rfind('\n', 0, posicion)
+
 # --------------------------------------------------------------
 # CONSTRUCTOR DEL LÉXER
 # --------------------------------------------------------------
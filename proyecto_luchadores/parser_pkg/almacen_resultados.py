@@ -0,0 +1,235 @@
+# ==============================================================
+#  parser_pkg/almacen_resultados.py
+# ==============================================================
+#  MEMORIA PERSISTENTE DE RESULTADOS DE COMBATE
+# --------------------------------------------------------------
+#  Un combate es determinista: su resultado solo depende de las
+#  definiciones de los dos luchadores, de sus guiones de turno,
+#  de quién inicia y de turnos_max (y de la versión del motor,
+#  VERSION_MOTOR). Este módulo calcula una
+#  huella canónica de esas entradas y guarda el resultado en una
+#  base SQLite local, de modo que:
+#   - luchadores idénticos (aunque tengan otro nombre) comparten
+#     los mismos combates ya simulados;
+#   - al editar un luchador de un torneo solo se vuelven a
+#     simular los enfrentamientos en los que participa.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m parser_pkg.almacen_resultados biblioteca.txt --db torneo.sqlite
+# ==============================================================
+
+import argparse
+import hashlib
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from parser_pkg.formateador import formatear_accion, formatear_combo, formatear_instrucciones
+from parser_pkg.forma_cerrada import resolver
+from parser_pkg.motor_combate import Resultado, enfrentar, guion_de
+from parser_pkg.parseo_paralelo import analizar_paralelo
+
+# SQLite limita la cantidad de parámetros por consulta
+TAM_CONSULTA = 500
+
+# Versión de la semántica de simulación (motor_combate y forma_cerrada).
+# Forma parte de cada clave: hay que incrementarla siempre que cambie
+# el resultado de algún combate, para que las bases existentes no
+# devuelvan resultados del motor anterior.
+VERSION_MOTOR = 1
+
+# --------------------------------------------------------------
+# HUELLAS CANÓNICAS
+# --------------------------------------------------------------
+
+def _resumen(texto):
+    return hashlib.blake2b(texto.encode("utf-8"), digest_size=16).digest()
+
+
+def huella_luchador(luchador):
+    """
+    Huella de la definición de un luchador (stats, acciones y combos)
+    sin su nombre: dos luchadores idénticos tienen la misma huella.
+    """
+    partes = [f"{luchador.hp_max},{luchador.st_max}"]
+    partes += sorted(formatear_accion(a) for a in luchador.acciones.values())
+    partes += sorted(formatear_combo(c) for c in luchador.combos.values())
+    return _resumen("\n".join(partes))
+
+
+def huella_guion(instrucciones):
+    return _resumen("\n".join(formatear_instrucciones(instrucciones, 0)))
+
+
+def clave_combate(luch1, guion1, luch2, guion2, turnos_max):
+    """Clave del combate en el que `luch1` (con `guion1`) inicia contra `luch2`."""
+    return hashlib.blake2b(VERSION_MOTOR.to_bytes(4, "little") + luch1 + guion1 + luch2 + guion2
+                           + turnos_max.to_bytes(4, "little"), digest_size=16).digest()
+
+# --------------------------------------------------------------
+# ALMACÉN SQLITE
+# --------------------------------------------------------------
+
+class AlmacenResultados:
+    """
+    Tabla clave -> (hp1, st1, hp2, st2, turnos) guardada en SQLite.
+    Con ruta ":memory:" el almacén solo vive mientras dure el proceso.
+    """
+    def __init__(self, ruta=":memory:"):
+        self.conexion = sqlite3.connect(ruta)
+        self.conexion.execute(
+            "CREATE TABLE IF NOT EXISTS combates ("
+            " clave BLOB PRIMARY KEY,"
+            " hp1 INTEGER, st1 INTEGER, hp2 INTEGER, st2 INTEGER, turnos INTEGER"
+            ") WITHOUT ROWID")
+
+    def buscar(self, claves):
+        """Devuelve {clave: tupla} con las claves que ya están guardadas."""
+        claves = list(claves)
+        encontrados = {}
+        for i in range(0, len(claves), TAM_CONSULTA):
+            lote = claves[i:i + TAM_CONSULTA]
+            marcas = ",".join("?" * len(lote))
+            for fila in self.conexion.execute(
+                    f"SELECT clave, hp1, st1, hp2, st2, turnos FROM combates "
+                    f"WHERE clave IN ({marcas})", lote):
+                encontrados[fila[0]] = fila[1:]
+        return encontrados
+
+    def guardar(self, filas):
+        """Inserta en bloque una lista de (clave, (hp1, st1, hp2, st2, turnos))."""
+        with self.conexion:
+            self.conexion.executemany(
+                "INSERT OR REPLACE INTO combates VALUES (?, ?, ?, ?, ?, ?)",
+                ((clave,) + tuple(valores) for clave, valores in filas))
+
+    def __len__(self):
+        return self.conexion.execute("SELECT COUNT(*) FROM combates").fetchone()[0]
+
+    def cerrar(self):
+        self.conexion.close()
+
+# --------------------------------------------------------------
+# TORNEO INCREMENTAL
+# --------------------------------------------------------------
+
+_programa = None
+
+def _preparar(programa):
+    global _programa
+    _programa = programa
+
+def _simular_lote(pares):
+    return [enfrentar(_programa, a, b, motor=resolver).como_tupla() for a, b in pares]
+
+
+def simular_pendientes(programa, pares, claves, almacen, procesos=1, tam_lote=256):
+    """
+    Devuelve {clave: (hp1, st1, hp2, st2, turnos)} para los combates
+    `pares` (con sus `claves`) y la cantidad de combates simulados.
+    Solo se simulan las claves que no están en `almacen`, una vez cada
+    una, y se guardan en él.
+    """
+    conocidos = almacen.buscar(set(claves))
+    pendientes = {}
+    for par, clave in zip(pares, claves):
+        if clave not in conocidos and clave not in pendientes:
+            pendientes[clave] = par
+
+    if pendientes:
+        lista = list(pendientes.items())
+        if procesos > 1 and len(lista) > tam_lote:
+            lotes = [[par for _, par in lista[i:i + tam_lote]]
+                     for i in range(0, len(lista), tam_lote)]
+            with ProcessPoolExecutor(max_workers=procesos, initializer=_preparar,
+                                     initargs=(programa,)) as pool:
+                tuplas = [t for parcial in pool.map(_simular_lote, lotes) for t in parcial]
+        else:
+            _preparar(programa)
+            tuplas = _simular_lote([par for _, par in lista])
+        nuevos = [(clave, tupla) for (clave, _), tupla in zip(lista, tuplas)]
+        almacen.guardar(nuevos)
+        conocidos.update(nuevos)
+    return conocidos, len(pendientes)
+
+
+def torneo(programa, almacen, procesos=1, tam_lote=256):
+    """
+    Todos contra todos (cada par pelea dos veces, una iniciando cada uno).
+    Solo se simulan los combates cuya clave no está en `almacen`; los
+    combates con la misma clave dentro del torneo se simulan una vez.
+    Devuelve (resultados, simulados) donde resultados es una lista de
+    (nombre1, nombre2, Resultado) con nombre1 como luchador que inicia.
+    """
+    turnos_max = programa.simulacion.config.turnos
+    nombres = list(programa.luchadores)
+    huellas = {n: huella_luchador(programa.luchadores[n]) for n in nombres}
+    guiones = {n: huella_guion(guion_de(programa, n)) for n in nombres}
+
+    pares, claves = [], []
+    for a in nombres:
+        for b in nombres:
+            if a != b:
+                pares.append((a, b))
+                claves.append(clave_combate(huellas[a], guiones[a],
+                                            huellas[b], guiones[b], turnos_max))
+
+    conocidos, simulados = simular_pendientes(programa, pares, claves, almacen,
+                                              procesos, tam_lote)
+    resultados = [(a, b, Resultado(a, b, *conocidos[clave]))
+                  for (a, b), clave in zip(pares, claves)]
+    return resultados, simulados
+
+
+def tabla_posiciones(resultados):
+    """Devuelve [(nombre, victorias, empates, derrotas)] ordenada por puntos."""
+    tabla = {}
+    for a, b, r in resultados:
+        for nombre in (a, b):
+            tabla.setdefault(nombre, [0, 0, 0])
+        if r.ganador is None:
+            tabla[a][1] += 1
+            tabla[b][1] += 1
+        else:
+            perdedor = b if r.ganador == a else a
+            tabla[r.ganador][0] += 1
+            tabla[perdedor][2] += 1
+    return sorted(((n, *v) for n, v in tabla.items()),
+                  key=lambda fila: (-(2 * fila[1] + fila[2]), fila[0]))
+
+# --------------------------------------------------------------
+# LÍNEA DE COMANDOS
+# --------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Torneo todos contra todos con memoria persistente de resultados.")
+    parser.add_argument("archivo", help="archivo fuente con la biblioteca de luchadores")
+    parser.add_argument("--db", default="resultados.sqlite",
+                        help="base SQLite donde se guardan los combates")
+    parser.add_argument("-j", "--procesos", type=int, default=1)
+    parser.add_argument("--top", type=int, default=10, help="posiciones a mostrar")
+    args = parser.parse_args(argv)
+
+    with open(args.archivo, "r", encoding="utf-8") as f:
+        programa, diagnosticos = analizar_paralelo(f.read(), args.procesos)
+    if diagnosticos:
+        for d in diagnosticos:
+            print(f"{args.archivo}:{d}")
+        return 1
+
+    almacen = AlmacenResultados(args.db)
+    inicio = time.perf_counter()
+    resultados, simulados = torneo(programa, almacen, args.procesos)
+    duracion = time.perf_counter() - inicio
+    almacen.cerrar()
+
+    print(f"{len(resultados)} combates, {simulados} simulados, "
+          f"{len(resultados) - simulados} reutilizados ({duracion:.2f} s)\n")
+    for pos, (nombre, g, e, p) in enumerate(tabla_posiciones(resultados)[:args.top], 1):
+        print(f"{pos:>4}. {nombre:<20} G={g} E={e} P={p}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
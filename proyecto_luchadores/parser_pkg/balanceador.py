@@ -0,0 +1,260 @@
+# ==============================================================
+#  parser_pkg/balanceador.py
+# ==============================================================
+#  BALANCEO AUTOMÁTICO DE ESTADÍSTICAS
+# --------------------------------------------------------------
+#  Trata cada valor numérico de la biblioteca como un parámetro:
+#    - stats(hp, st) de cada luchador
+#    - daño y costo de cada AccionAtomica
+#    - st_req de cada Combo
+#  y los ajusta por descenso por coordenadas hasta que cada par
+#  de luchadores gane aproximadamente el 50% de sus combates
+#  (cada par pelea dos veces, una iniciando cada uno).
+#   - Los candidatos de cada iteración se evalúan en lote en un
+#     pool de procesos (cada proceso parsea el programa una vez).
+#   - Los vectores ya evaluados se memorizan y no se repiten.
+#  El resultado se escribe como un archivo fuente nuevo.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m parser_pkg.balanceador ejemplos/dragon_ball.txt -o balanceado.txt
+# ==============================================================
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+from parser_pkg.gramatica import AccionAtomica, Combo, Luchador, Programa
+from parser_pkg.forma_cerrada import resolver
+from parser_pkg.interprete import analizar
+from parser_pkg.motor_combate import enfrentar
+from parser_pkg.formateador import formatear_programa
+
+# Peso del margen de HP en el objetivo: desempata configuraciones
+# con el mismo resultado para que la búsqueda no se quede en mesetas.
+PESO_MARGEN = 0.25
+
+# --------------------------------------------------------------
+# PARÁMETROS
+# --------------------------------------------------------------
+
+class Parametro:
+    """
+    Un valor numérico ajustable de la biblioteca.
+    clase: "stats", "accion" o "combo"; campo: hp, st, daño, costo o st_req.
+    """
+    def __init__(self, luchador, clase, nombre, campo, minimo):
+        self.luchador = luchador
+        self.clase = clase
+        self.nombre = nombre
+        self.campo = campo
+        self.minimo = minimo
+
+    def __repr__(self):
+        return f"<Parametro {self.luchador}.{self.nombre}.{self.campo}>"
+
+
+def extraer_parametros(programa, luchadores=None):
+    """
+    Devuelve (parametros, vector_inicial) con los campos numéricos de los
+    luchadores indicados (por defecto, todos los de la biblioteca).
+    """
+    parametros, vector = [], []
+    for nombre, l in programa.luchadores.items():
+        if luchadores is not None and nombre not in luchadores:
+            continue
+        parametros += [Parametro(nombre, "stats", nombre, "hp", 1),
+                       Parametro(nombre, "stats", nombre, "st", 0)]
+        vector += [l.hp_max, l.st_max]
+        for accion in l.acciones.values():
+            if accion.tipo == "bloqueo":
+                continue
+            parametros += [Parametro(nombre, "accion", accion.nombre, "daño", 0),
+                           Parametro(nombre, "accion", accion.nombre, "costo", 0)]
+            vector += [accion.daño, accion.costo]
+        for combo in l.combos.values():
+            parametros.append(Parametro(nombre, "combo", combo.nombre, "st_req", 0))
+            vector.append(combo.st_req)
+    return parametros, tuple(vector)
+
+
+def aplicar_parametros(programa, parametros, vector):
+    """
+    Devuelve un Programa nuevo con los valores de `vector`. Los luchadores
+    modificados se reconstruyen con objetos nuevos, el original no cambia.
+    """
+    cambios = {}
+    for p, valor in zip(parametros, vector):
+        cambios.setdefault(p.luchador, {})[(p.clase, p.nombre, p.campo)] = valor
+
+    luchadores = {}
+    for nombre, l in programa.luchadores.items():
+        c = cambios.get(nombre)
+        if c is None:
+            luchadores[nombre] = l
+            continue
+        nuevo = Luchador(nombre,
+                         c.get(("stats", nombre, "hp"), l.hp_max),
+                         c.get(("stats", nombre, "st"), l.st_max))
+        for clave, a in l.acciones.items():
+            nuevo.acciones[clave] = AccionAtomica(
+                a.tipo, a.nombre,
+                danio=c.get(("accion", a.nombre, "daño"), a.daño),
+                costo=c.get(("accion", a.nombre, "costo"), a.costo),
+                altura=a.altura, forma=a.forma, giratoria=a.giratoria)
+        for clave, co in l.combos.items():
+            nuevo.combos[clave] = Combo(co.nombre,
+                                        c.get(("combo", co.nombre, "st_req"), co.st_req),
+                                        co.acciones)
+        luchadores[nombre] = nuevo
+    return Programa(luchadores, programa.simulacion)
+
+# --------------------------------------------------------------
+# FUNCIÓN OBJETIVO
+# --------------------------------------------------------------
+
+def desequilibrio(programa):
+    """
+    Suma, sobre cada par de luchadores, el cuadrado de la distancia al 50%
+    de victorias más PESO_MARGEN por el cuadrado del margen medio de HP
+    (en fracción de la vida máxima). 0 es un equilibrio perfecto.
+    """
+    total = 0.0
+    for a, b in combinations(programa.luchadores, 2):
+        la, lb = programa.luchadores[a], programa.luchadores[b]
+        puntos = margen = 0.0
+        for inicia in (a, b):
+            r = enfrentar(programa, a, b, inicia=inicia, motor=resolver)
+            puntos += 1.0 if r.ganador == a else 0.5 if r.ganador is None else 0.0
+            margen += r.hp1 / max(la.hp_max, 1) - r.hp2 / max(lb.hp_max, 1)
+        total += (puntos / 2 - 0.5) ** 2 + PESO_MARGEN * (margen / 2) ** 2
+    return total
+
+# --------------------------------------------------------------
+# EVALUACIÓN EN PARALELO
+# --------------------------------------------------------------
+
+_base = None
+_parametros = None
+
+def _preparar(texto, luchadores):
+    """Inicializador de cada proceso: parsea el programa base una vez."""
+    global _base, _parametros
+    _base, _ = analizar(texto)
+    _parametros, _ = extraer_parametros(_base, luchadores)
+
+def _evaluar(vector):
+    return desequilibrio(aplicar_parametros(_base, _parametros, vector))
+
+
+class Evaluador:
+    """
+    Evalúa vectores de parámetros en lotes, en paralelo, recordando
+    el puntaje de los que ya se calcularon.
+    """
+    def __init__(self, texto, luchadores=None, procesos=None):
+        self.memo = {}
+        self.procesos = procesos or os.cpu_count() or 1
+        self.pool = None
+        _preparar(texto, luchadores)
+        if self.procesos > 1:
+            self.pool = ProcessPoolExecutor(max_workers=self.procesos,
+                                            initializer=_preparar,
+                                            initargs=(texto, luchadores))
+
+    def evaluar(self, vectores):
+        pendientes = list(dict.fromkeys(v for v in vectores if v not in self.memo))
+        if self.pool is not None and len(pendientes) > 1:
+            puntajes = self.pool.map(_evaluar, pendientes,
+                                     chunksize=max(1, len(pendientes) // (4 * self.procesos)))
+        else:
+            puntajes = map(_evaluar, pendientes)
+        self.memo.update(zip(pendientes, puntajes))
+        return [self.memo[v] for v in vectores]
+
+    def cerrar(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+
+# --------------------------------------------------------------
+# BÚSQUEDA POR COORDENADAS
+# --------------------------------------------------------------
+
+def balancear(texto, luchadores=None, iteraciones=100, tolerancia=1e-3,
+              procesos=None, log=print):
+    """
+    Ajusta los parámetros del programa `texto` y devuelve
+    (programa_balanceado, puntaje_inicial, puntaje_final).
+    En cada iteración se prueba mover cada parámetro +-paso; se acepta
+    el mejor movimiento y, si ninguno mejora, se reducen los pasos a la
+    mitad. Termina cuando los pasos valen 1 y nada mejora.
+    """
+    base, diagnosticos = analizar(texto)
+    if diagnosticos:
+        raise SyntaxError("; ".join(str(d) for d in diagnosticos))
+    parametros, vector = extraer_parametros(base, luchadores)
+    pasos = [max(1, v // 4) for v in vector]
+
+    evaluador = Evaluador(texto, luchadores, procesos)
+    try:
+        actual = inicial = evaluador.evaluar([vector])[0]
+        for iteracion in range(iteraciones):
+            if actual <= tolerancia:
+                break
+            candidatos = []
+            for i, p in enumerate(parametros):
+                for signo in (1, -1):
+                    nuevo = list(vector)
+                    nuevo[i] = max(p.minimo, nuevo[i] + signo * pasos[i])
+                    if nuevo[i] != vector[i]:
+                        candidatos.append(tuple(nuevo))
+            puntajes = evaluador.evaluar(candidatos)
+            mejor = min(range(len(candidatos)), key=puntajes.__getitem__, default=None)
+
+            if mejor is not None and puntajes[mejor] < actual:
+                vector, actual = candidatos[mejor], puntajes[mejor]
+                log(f"  iteración {iteracion + 1}: desequilibrio {actual:.4f}")
+            elif any(paso > 1 for paso in pasos):
+                pasos = [max(1, paso // 2) for paso in pasos]
+            else:
+                break
+        log(f"  {len(evaluador.memo)} configuraciones evaluadas")
+    finally:
+        evaluador.cerrar()
+
+    return aplicar_parametros(base, parametros, vector), inicial, actual
+
+# --------------------------------------------------------------
+# LÍNEA DE COMANDOS
+# --------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Ajusta stats, daño, costo y st_req para equilibrar los combates.")
+    parser.add_argument("archivo", help="archivo fuente con la biblioteca de luchadores")
+    parser.add_argument("-o", "--salida", help="archivo a escribir (por defecto <archivo>.balanceado.txt)")
+    parser.add_argument("-l", "--luchador", action="append", dest="luchadores",
+                        help="ajustar solo este luchador (se puede repetir)")
+    parser.add_argument("-n", "--iteraciones", type=int, default=100)
+    parser.add_argument("-j", "--procesos", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    with open(args.archivo, "r", encoding="utf-8") as f:
+        texto = f.read()
+    try:
+        programa, inicial, final = balancear(texto, args.luchadores,
+                                             args.iteraciones, procesos=args.procesos)
+    except SyntaxError as e:
+        print(f" Error de sintaxis: {e}")
+        return 1
+
+    salida = args.salida or os.path.splitext(args.archivo)[0] + ".balanceado.txt"
+    with open(salida, "w", encoding="utf-8") as f:
+        f.write(formatear_programa(programa))
+    print(f"Desequilibrio: {inicial:.4f} -> {final:.4f}")
+    print(f"Archivo balanceado escrito en {salida}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+# ==============================================================
+#  parser_pkg/batalla_campal.py
+# ==============================================================
+#  BATALLA CAMPAL ENTRE N LUCHADORES
+# --------------------------------------------------------------
+#  Con `luchadores: A vs B vs C ...;` en la configuración pelean
+#  todos a la vez: en cada ronda actúa cada luchador vivo (primero
+#  el que inicia y luego los demás en el orden declarado) contra
+#  un objetivo elegido por una política:
+#    - menor_hp: el rival con menos HP (rematar al más débil);
+#    - mayor_hp: el rival con más HP (atacar al más fuerte).
+#  Durante su turno `oponente` es ese objetivo; quien no tenga
+#  turno en `pelea` usa su guion por defecto (el de enfrentar,
+#  motor_combate.guion_de). Un luchador que llega a 0 HP queda
+#  eliminado; gana el último en pie (o, al agotarse los turnos,
+#  el de más HP).
+#  Para que un turno cueste O(log N) con miles de luchadores:
+#   - el orden de turnos es un montículo de (ronda, posición);
+#   - los objetivos salen de un montículo ordenado por HP que se
+#     actualiza al recibir daño;
+#   - los eliminados se marcan y se descartan al llegar a la cima
+#     de cada montículo (borrado perezoso), sin reconstruir nada.
+#  Con dos luchadores motor_combate.ejecutar sigue usando pelear.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m parser_pkg.batalla_campal ejemplos/batalla_campal/mortal_kombat.txt
+# ==============================================================
+
+import argparse
+import heapq
+import sys
+
+from parser_pkg.interprete import analizar
+from parser_pkg.motor_combate import ejecutar_turno, guion_de
+
+POLITICAS = ("menor_hp", "mayor_hp")
+
+
+def _silencio(*args, **kwargs):
+    """Registro vacío: descarta los mensajes del combate."""
+
+
+class ResultadoCampal:
+    """
+    Estado final de una batalla campal: HP y ST de cada luchador (en
+    el orden de la configuración), turnos jugados y eliminados en orden
+    como (nombre, turno).
+    """
+    def __init__(self, nombres, hp, st, turnos, eliminados):
+        self.nombres = nombres
+        self.hp = hp
+        self.st = st
+        self.turnos = turnos
+        self.eliminados = eliminados
+
+    @property
+    def ganador(self):
+        """El luchador con más HP (None si hay empate en el primer puesto)."""
+        mejor = max(self.hp)
+        if self.hp.count(mejor) > 1:
+            return None
+        return self.nombres[self.hp.index(mejor)]
+
+    def __repr__(self):
+        return (f"<ResultadoCampal {len(self.nombres)} luchadores "
+                f"ganador={self.ganador} turnos={self.turnos}>")
+
+# --------------------------------------------------------------
+# ELECCIÓN DE OBJETIVOS
+# --------------------------------------------------------------
+
+class Objetivos:
+    """
+    Montículo de los luchadores vivos ordenado por HP (de menor a mayor
+    con signo 1, de mayor a menor con -1; a igual HP, el primero de la
+    configuración). Cada cambio de HP agrega una entrada nueva; las
+    viejas y las de eliminados se descartan al llegar a la cima.
+    """
+    def __init__(self, luchadores, vivos, signo):
+        self._luchadores = luchadores
+        self._vivos = vivos
+        self._signo = signo
+        self._monticulo = [(signo * l.hp, i) for i, l in enumerate(luchadores) if vivos[i]]
+        heapq.heapify(self._monticulo)
+
+    def actualizar(self, i):
+        """Registra que cambió el HP del luchador i."""
+        heapq.heappush(self._monticulo, (self._signo * self._luchadores[i].hp, i))
+
+    def _limpiar(self):
+        monticulo = self._monticulo
+        while monticulo:
+            valor, i = monticulo[0]
+            if self._vivos[i] and valor == self._signo * self._luchadores[i].hp:
+                return
+            heapq.heappop(monticulo)
+
+    def elegir(self, yo):
+        """Índice del objetivo de `yo` (None si no quedan rivales)."""
+        monticulo = self._monticulo
+        self._limpiar()
+        if not monticulo:
+            return None
+        if monticulo[0][1] != yo:
+            return monticulo[0][1]
+        # El primero es el propio luchador: se aparta un momento
+        propia = heapq.heappop(monticulo)
+        self._limpiar()
+        elegido = monticulo[0][1] if monticulo else None
+        heapq.heappush(monticulo, propia)
+        return elegido
+
+# --------------------------------------------------------------
+# COMBATE
+# --------------------------------------------------------------
+
+def pelear_campal(luchadores, turnos, inicia, turnos_max, politica="menor_hp", log=_silencio):
+    """
+    Simula la batalla entre los luchadores (ya clonados) de la lista.
+    `turnos` asocia el nombre de cada luchador con sus instrucciones;
+    quien no tenga turno no actúa (igual que en motor_combate.pelear).
+    Modifica el HP/ST de los luchadores y devuelve un ResultadoCampal.
+    """
+    if politica not in POLITICAS:
+        raise ValueError(f"política de objetivo desconocida: {politica}")
+    nombres = [l.nombre for l in luchadores]
+    vivos = [l.hp > 0 for l in luchadores]
+    quedan = sum(vivos)
+    objetivos = Objetivos(luchadores, vivos, 1 if politica == "menor_hp" else -1)
+
+    # Orden de turnos: primero el que inicia, luego los demás en orden
+    primero = nombres.index(inicia) if inicia in nombres else 0
+    orden = [primero] + [i for i in range(len(luchadores)) if i != primero]
+    cola = [(0, posicion) for posicion, i in enumerate(orden) if vivos[i] and turnos_max > 0]
+    guiones = [turnos.get(nombre) for nombre in nombres]
+
+    eliminados = []
+    jugados = turnos_max if quedan > 1 else 0
+    while cola and quedan > 1:
+        ronda, posicion = heapq.heappop(cola)
+        i = orden[posicion]
+        if not vivos[i]:
+            continue          # eliminado: no vuelve a la cola
+        if guiones[i] is not None:
+            j = objetivos.elegir(i)
+            yo, rival = luchadores[i], luchadores[j]
+            log(f"  Turno {ronda + 1} de {yo.nombre} (objetivo: {rival.nombre}):")
+            hp_antes = rival.hp
+            ejecutar_turno(guiones[i], yo, rival, log)
+            if rival.hp != hp_antes:
+                objetivos.actualizar(j)
+            if rival.hp <= 0:
+                vivos[j] = False
+                quedan -= 1
+                eliminados.append((rival.nombre, ronda + 1))
+                log(f" {rival.nombre} queda eliminado")
+                if quedan <= 1:
+                    jugados = ronda + 1
+                    break
+        if ronda + 1 < turnos_max:
+            heapq.heappush(cola, (ronda + 1, posicion))
+
+    return ResultadoCampal(nombres, [l.hp for l in luchadores], [l.st for l in luchadores],
+                           jugados, eliminados)
+
+
+def guiones_campal(programa):
+    """Guion de cada luchador de la configuración (ver motor_combate.guion_de)."""
+    sim = programa.simulacion
+    turnos = {t.luchador: t.acciones for t in sim.turnos}
+    for nombre in sim.config.luchadores:
+        if nombre not in turnos:
+            turnos[nombre] = guion_de(programa, nombre)
+    return turnos
+
+
+def ejecutar_campal(programa, politica="menor_hp"):
+    """Ejecuta e imprime la batalla campal descrita en el objeto Programa."""
+    config = programa.simulacion.config
+    luchadores = [programa.luchadores[nombre].clonar() for nombre in config.luchadores]
+
+    print(f"\n  BATALLA CAMPAL: {len(luchadores)} luchadores (objetivo: {politica})")
+    print(f"Turnos máximos: {config.turnos}\n")
+
+    resultado = pelear_campal(luchadores, guiones_campal(programa), config.inicia,
+                              config.turnos, politica, log=print)
+
+    print("\n RESULTADO FINAL:")
+    for l in luchadores:
+        print(f"{l.nombre}: HP={l.hp}, ST={l.st}")
+    if resultado.ganador:
+        print(f" Gana {resultado.ganador}")
+    else:
+        print(" Empate")
+    return resultado
+
+# --------------------------------------------------------------
+# LÍNEA DE COMANDOS
+# --------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batalla campal entre N luchadores.")
+    parser.add_argument("archivo", help="archivo fuente con la simulación")
+    parser.add_argument("--objetivo", choices=POLITICAS, default="menor_hp",
+                        help="a qué rival ataca cada luchador")
+    parser.add_argument("--silencio", action="store_true",
+                        help="mostrar solo la clasificación final")
+    args = parser.parse_args(argv)
+
+    with open(args.archivo, "r", encoding="utf-8") as f:
+        programa, diagnosticos = analizar(f.read())
+    if diagnosticos:
+        for d in diagnosticos:
+            print(f"{args.archivo}:{d}")
+        return 1
+
+    if not args.silencio:
+        ejecutar_campal(programa, args.objetivo)
+        return 0
+
+    config = programa.simulacion.config
+    luchadores = [programa.luchadores[nombre].clonar() for nombre in config.luchadores]
+    r = pelear_campal(luchadores, guiones_campal(programa), config.inicia, config.turnos,
+                      args.objetivo)
+    ganador = f"gana {r.ganador}" if r.ganador else "empate"
+    print(f"{len(luchadores)} luchadores, {r.turnos} turnos: {ganador}")
+    for nombre, turno in reversed(r.eliminados[-10:]):
+        print(f"  eliminado en el turno {turno:>3}: {nombre}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
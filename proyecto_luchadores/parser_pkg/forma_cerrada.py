@@ -0,0 +1,145 @@
+# ==============================================================
+#  parser_pkg/forma_cerrada.py
+# ==============================================================
+#  EVALUACIÓN ANALÍTICA DE COMBATES SIN CONDICIONES
+# --------------------------------------------------------------
+#  Si los guiones de ambos luchadores solo contienen `usa` (sin
+#  `si`), un turno depende únicamente del ST propio: mientras
+#  todas las comprobaciones de ST (st_req de combos y costo de
+#  acciones) den el mismo resultado, cada ronda resta el mismo
+#  ST y hace el mismo daño. Este módulo calcula cuántas rondas
+#  dura cada uno de esos "regímenes" y salta directamente al
+#  final de cada uno, de modo que el coste es proporcional al
+#  número de cambios de régimen y no a turnos_max.
+#  El resultado es idéntico al de motor_combate.pelear; en
+#  cualquier caso no cubierto se usa el intérprete.
+# ==============================================================
+
+from parser_pkg.gramatica import Usar
+from parser_pkg.motor_combate import Resultado, pelear
+
+
+class _NoAplica(Exception):
+    """El combate no cumple las condiciones de la vía rápida."""
+
+
+def _trazar_accion(nombre, yo, estado):
+    """
+    Réplica silenciosa de motor_combate.aplicar_accion que solo
+    modifica `estado` = [st, daño, holguras]. Cada comprobación
+    de ST superada añade su holgura (st - umbral) a la lista.
+    """
+    if nombre in yo.combos:
+        combo = yo.combos[nombre]
+        if combo.st_req < 0:
+            raise _NoAplica
+        if estado[0] >= combo.st_req:
+            estado[2].append(estado[0] - combo.st_req)
+            estado[0] -= combo.st_req
+            for act in combo.acciones:
+                _trazar_accion(act, yo, estado)
+        else:
+            _trazar_accion(combo.acciones[0], yo, estado)
+    elif nombre in yo.acciones:
+        accion = yo.acciones[nombre]
+        if accion.tipo == "bloqueo":
+            return
+        if accion.costo < 0 or accion.daño < 0:
+            raise _NoAplica
+        if estado[0] < accion.costo:
+            return
+        estado[2].append(estado[0] - accion.costo)
+        estado[0] -= accion.costo
+        estado[1] += accion.daño
+
+
+def _trazar_turno(guion, yo, st):
+    """
+    Devuelve (gasto_st, daño, rondas): lo que gasta y hace el turno
+    empezando con `st`, y durante cuántas rondas seguidas se repite
+    exactamente igual (None = indefinidamente).
+    """
+    estado = [st, 0, []]
+    for instr in guion:
+        _trazar_accion(instr.nombre, yo, estado)
+    gasto = st - estado[0]
+    if gasto == 0:
+        return 0, estado[1], None
+    # Una comprobación superada sigue superándose mientras
+    # holgura - m * gasto >= 0; las fallidas no vuelven a pasar
+    # porque el ST nunca sube.
+    return gasto, estado[1], min(h // gasto for h in estado[2]) + 1
+
+
+def _rondas_para_derribar(hp, danio):
+    if danio <= 0:
+        return None
+    return -(-hp // danio)
+
+
+def es_aplicable(l1, l2, turnos, inicia):
+    """Indica si el combate puede resolverse por la vía rápida."""
+    if l1.nombre == l2.nombre or inicia not in (l1.nombre, l2.nombre):
+        return False
+    if l1.hp <= 0 or l2.hp <= 0:
+        return False
+    for nombre in (l1.nombre, l2.nombre):
+        guion = turnos.get(nombre)
+        if guion is None or not all(isinstance(i, Usar) for i in guion):
+            return False
+    return True
+
+
+def resolver(l1, l2, turnos, inicia, turnos_max):
+    """
+    Igual que motor_combate.pelear (sin registro de mensajes): modifica
+    el HP/ST de l1 y l2 y devuelve el Resultado, usando la vía rápida
+    cuando es posible.
+    """
+    if not es_aplicable(l1, l2, turnos, inicia):
+        return pelear(l1, l2, turnos, inicia, turnos_max)
+
+    a, b = (l1, l2) if inicia == l1.nombre else (l2, l1)
+    guion_a, guion_b = turnos[a.nombre], turnos[b.nombre]
+    hp_a, st_a, hp_b, st_b = a.hp, a.st, b.hp, b.st
+
+    try:
+        ronda = 0
+        jugados = turnos_max
+        while ronda < turnos_max:
+            gasto_a, danio_a, rondas_a = _trazar_turno(guion_a, a, st_a)
+            gasto_b, danio_b, rondas_b = _trazar_turno(guion_b, b, st_b)
+            k = turnos_max - ronda
+            for r in (rondas_a, rondas_b):
+                if r is not None:
+                    k = min(k, r)
+
+            # Ronda (dentro del régimen) en la que cada uno derriba al otro.
+            # `a` actúa primero, así que gana los empates de ronda.
+            caida_b = _rondas_para_derribar(hp_b, danio_a)
+            caida_a = _rondas_para_derribar(hp_a, danio_b)
+            if caida_b is not None and caida_b <= k and (caida_a is None or caida_b <= caida_a):
+                hp_b = 0
+                hp_a -= (caida_b - 1) * danio_b
+                st_a -= caida_b * gasto_a
+                st_b -= (caida_b - 1) * gasto_b
+                jugados = ronda + caida_b
+                break
+            if caida_a is not None and caida_a <= k:
+                hp_a = 0
+                hp_b -= caida_a * danio_a
+                st_a -= caida_a * gasto_a
+                st_b -= caida_a * gasto_b
+                jugados = ronda + caida_a
+                break
+
+            hp_a -= k * danio_b
+            hp_b -= k * danio_a
+            st_a -= k * gasto_a
+            st_b -= k * gasto_b
+            ronda += k
+    except (_NoAplica, RecursionError):
+        return pelear(l1, l2, turnos, inicia, turnos_max)
+
+    a.hp, a.st, b.hp, b.st = hp_a, st_a, hp_b, st_b
+    return Resultado(l1.nombre, l2.nombre, l1.hp, l1.st, l2.hp, l2.st, jugados)
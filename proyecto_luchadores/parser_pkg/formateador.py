@@ -0,0 +1,86 @@
+# ==============================================================
+#  parser_pkg/formateador.py
+# ==============================================================
+#  ESCRITURA DEL PROGRAMA COMO CÓDIGO FUENTE
+# --------------------------------------------------------------
+#  Operación inversa del parser: convierte los objetos de
+#  gramatica.py de nuevo en texto del lenguaje de luchadores,
+#  con un formato canónico (mismo estilo que los ejemplos).
+#  Se usa para guardar luchadores modificados por herramientas
+#  (por ejemplo el balanceador) y para comparar definiciones.
+# ==============================================================
+
+from parser_pkg.gramatica import Usar, SiSino
+
+SANGRIA = "  "
+
+
+def formatear_accion(accion):
+    """Devuelve la línea `golpe: nombre(...);` de una acción."""
+    if accion.tipo == "bloqueo":
+        return f"bloqueo: {accion.nombre};"
+    atributos = [f"daño={accion.daño}", f"costo={accion.costo}"]
+    if accion.altura is not None:
+        atributos.append(f"altura={accion.altura}")
+    if accion.forma is not None:
+        atributos.append(f"forma={accion.forma}")
+    atributos.append(f"giratoria={'si' if accion.giratoria else 'no'}")
+    return f"{accion.tipo}: {accion.nombre}({', '.join(atributos)});"
+
+
+def formatear_combo(combo):
+    return f"{combo.nombre}(st_req={combo.st_req}) {{ {', '.join(combo.acciones)} }}"
+
+
+def formatear_luchador(luchador):
+    """Devuelve el bloque `luchador NOMBRE { ... }` completo."""
+    lineas = [f"luchador {luchador.nombre} {{",
+              f"{SANGRIA}stats(hp={luchador.hp_max}, st={luchador.st_max});",
+              f"{SANGRIA}acciones {{"]
+    lineas += [SANGRIA * 2 + formatear_accion(a) for a in luchador.acciones.values()]
+    lineas += [f"{SANGRIA}}}", f"{SANGRIA}combos {{"]
+    lineas += [SANGRIA * 2 + formatear_combo(c) for c in luchador.combos.values()]
+    lineas += [f"{SANGRIA}}}", "}"]
+    return "\n".join(lineas)
+
+
+def formatear_instrucciones(lista, nivel):
+    """Devuelve las líneas de una lista de instrucciones con sangría `nivel`."""
+    pre = SANGRIA * nivel
+    lineas = []
+    for instr in lista:
+        if isinstance(instr, Usar):
+            lineas.append(f"{pre}usa {instr.nombre};")
+        elif isinstance(instr, SiSino):
+            lineas.append(f"{pre}si {instr.condicion} {{")
+            lineas += formatear_instrucciones(instr.bloque_si, nivel + 1)
+            if instr.bloque_sino:
+                lineas.append(f"{pre}}} sino {{")
+                lineas += formatear_instrucciones(instr.bloque_sino, nivel + 1)
+            lineas.append(f"{pre}}}")
+    return lineas
+
+
+def formatear_simulacion(simulacion):
+    """Devuelve el bloque `simulacion { ... }` completo."""
+    config = simulacion.config
+    lineas = ["simulacion {",
+              f"{SANGRIA}config {{",
+              f"{SANGRIA * 2}luchadores: {' vs '.join(config.luchadores)};",
+              f"{SANGRIA * 2}inicia: {config.inicia};",
+              f"{SANGRIA * 2}turnos_max: {config.turnos};",
+              f"{SANGRIA}}}",
+              f"{SANGRIA}pelea {{"]
+    for turno in simulacion.turnos:
+        lineas.append(f"{SANGRIA * 2}turno {turno.luchador} {{")
+        lineas += formatear_instrucciones(turno.acciones, 3)
+        lineas.append(f"{SANGRIA * 2}}}")
+    lineas += [f"{SANGRIA}}}", "}"]
+    return "\n".join(lineas)
+
+
+def formatear_programa(programa):
+    """Devuelve el código fuente completo de un Programa."""
+    bloques = [formatear_luchador(l) for l in programa.luchadores.values()]
+    bloques.append(formatear_simulacion(programa.simulacion))
+    return "\n\n".join(bloques) + "\n"
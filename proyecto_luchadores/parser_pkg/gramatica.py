@@ -16,16 +16,33 @@ class AccionAtomica:
     """
     Representa una acción básica del luchador:
     puede ser un golpe, una patada o un bloqueo.
+    Es inmutable: el parser comparte una misma instancia entre todos
+    los luchadores que definen una acción idéntica.
     """
+    __slots__ = ("tipo", "nombre", "daño", "costo", "altura", "forma",
+                 "giratoria", "__weakref__")
+
     def __init__(self, tipo, nombre, danio=0, costo=0,
                  altura=None, forma=None, giratoria=False):
-        self.tipo = tipo          # "golpe", "patada" o "bloqueo"
-        self.nombre = nombre
-        self.daño = danio          # mantener compatibilidad con “daño” en prints
-        self.costo = costo
-        self.altura = altura      # alta, media, baja
-        self.forma = forma        # frontal o lateral
-        self.giratoria = giratoria  # True o False
+        asignar = object.__setattr__
+        asignar(self, "tipo", tipo)          # "golpe", "patada" o "bloqueo"
+        asignar(self, "nombre", nombre)
+        asignar(self, "daño", danio)         # mantener compatibilidad con “daño” en prints
+        asignar(self, "costo", costo)
+        asignar(self, "altura", altura)      # alta, media, baja
+        asignar(self, "forma", forma)        # frontal o lateral
+        asignar(self, "giratoria", giratoria)  # True o False
+
+    def clave(self):
+        """Tupla con todos los campos: dos acciones con la misma clave son idénticas."""
+        return (self.tipo, self.nombre, self.daño, self.costo,
+                self.altura, self.forma, self.giratoria)
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError("AccionAtomica es inmutable; crea una acción nueva")
+
+    def __reduce__(self):
+        return (AccionAtomica, self.clave())
 
     def __repr__(self):
         return f"<Acción {self.nombre} ({self.tipo}) daño={self.daño} costo={self.costo}>"
@@ -36,11 +53,24 @@ class AccionAtomica:
 class Combo:
     """
     Representa un conjunto de acciones atómicas ejecutadas juntas.
+    Inmutable y compartido entre luchadores, igual que AccionAtomica.
     """
+    __slots__ = ("nombre", "st_req", "acciones", "__weakref__")
+
     def __init__(self, nombre, st_req, acciones):
-        self.nombre = nombre
-        self.st_req = st_req        # energía requerida
-        self.acciones = acciones    # lista de nombres de acciones
+        asignar = object.__setattr__
+        asignar(self, "nombre", nombre)
+        asignar(self, "st_req", st_req)             # energía requerida
+        asignar(self, "acciones", tuple(acciones))  # nombres de acciones
+
+    def clave(self):
+        return (self.nombre, self.st_req, self.acciones)
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError("Combo es inmutable; crea un combo nuevo")
+
+    def __reduce__(self):
+        return (Combo, self.clave())
 
     def __repr__(self):
         return f"<Combo {self.nombre} ST_req={self.st_req} acciones={self.acciones}>"
@@ -146,18 +176,22 @@ class Turno:
 class Configuracion:
     """
     Contiene los parámetros iniciales de la simulación:
-    - luchadores involucrados
+    - luchadores involucrados (luch1 y luch2 son los dos primeros;
+      `luchadores` es la lista completa, con más de dos en una
+      batalla campal)
     - quién inicia
     - cantidad de turnos
     """
-    def __init__(self, luch1, luch2, inicia, turnos):
+    def __init__(self, luch1, luch2, inicia, turnos, luchadores=None):
         self.luch1 = luch1
         self.luch2 = luch2
         self.inicia = inicia
         self.turnos = turnos
+        self.luchadores = luchadores or [luch1, luch2]
 
     def __repr__(self):
-        return f"<Config {self.luch1} vs {self.luch2} inicia={self.inicia} turnos={self.turnos}>"
+        return (f"<Config {' vs '.join(self.luchadores)} inicia={self.inicia} "
+                f"turnos={self.turnos}>")
 
 class Simulacion:
     """
@@ -183,3 +217,27 @@ class Programa:
 
     def __repr__(self):
         return f"<Programa con {len(self.luchadores)} luchadores>"
+
+# --------------------------------------------------------------
+# CLASE: Diagnostico
+# --------------------------------------------------------------
+class Diagnostico:
+    """
+    Error detectado al analizar un archivo fuente:
+    tipo ("lexico" o "sintactico"), línea, columna y mensaje.
+    """
+    def __init__(self, tipo, linea, columna, mensaje):
+        self.tipo = tipo
+        self.linea = linea
+        self.columna = columna
+        self.mensaje = mensaje
+
+    def a_dict(self):
+        return {"tipo": self.tipo, "linea": self.linea,
+                "columna": self.columna, "mensaje": self.mensaje}
+
+    def __str__(self):
+        return f"{self.linea}:{self.columna}: error {self.tipo}: {self.mensaje}"
+
+    def __repr__(self):
+        return f"<Diagnostico {self.tipo} {self.linea}:{self.columna} {self.mensaje}>"
@@ -10,14 +10,40 @@
 #   - Lógica de turnos, daño, energía y combos
 # ==============================================================
 
+import sys
+import weakref
+
 import ply.yacc as yacc
-from lexer.tokens import tokens, construir_lexer
+from lexer.tokens import tokens, construir_lexer, calcular_columna
 from parser_pkg.gramatica import *
 
 # --------------------------------------------------------------
 # TABLA DE SÍMBOLOS GLOBAL
 # --------------------------------------------------------------
 tabla_luchadores = {}
+posiciones_luchadores = {}   # nombre -> (línea, columna) de su última definición
+luchador_actual = None   # luchador cuya definición se está leyendo
+
+# Acciones y combos ya creados, indexados por su clave(): las
+# definiciones idénticas de distintos luchadores (o de distintos
+# archivos) comparten la misma instancia inmutable.
+acciones_internadas = weakref.WeakValueDictionary()
+combos_internados = weakref.WeakValueDictionary()
+
+def internar(objeto, tabla):
+    """Devuelve la instancia compartida equivalente a `objeto`."""
+    clave = objeto.clave()
+    compartido = tabla.get(clave)
+    if compartido is None:
+        tabla[clave] = compartido = objeto
+    return compartido
+
+# Lista donde se acumulan los errores en modo validación.
+# Con None los errores se imprimen por pantalla (modo normal).
+diagnosticos = None
+
+# Mensaje del error de sintaxis al terminar la entrada a mitad de una regla
+FIN_INESPERADO = "fin de archivo inesperado"
 
 # --------------------------------------------------------------
 # REGLAS DE LA GRAMÁTICA
@@ -25,7 +51,7 @@ tabla_luchadores = {}
 
 def p_programa(prog):
     """programa : definiciones bloque_simulacion"""
-    prog[0] = Programa(tabla_luchadores, prog[2])
+    prog[0] = Programa(dict(tabla_luchadores), prog[2])
 
 # --------------------------------------------------------------
 # BLOQUE: DEFINICIONES DE LUCHADORES
@@ -42,8 +68,15 @@ def p_definicion(prog):
 
 def p_cabecera(prog):
     """cabecera : LUCHADOR ID LLAVE_ABRE"""
+    global luchador_actual
     nombre = prog[2]
-    tabla_luchadores[nombre] = Luchador(nombre, 0, 0)
+    linea = prog.lineno(2)
+    columna = calcular_columna(prog.lexer.lexdata, prog.lexpos(2))
+    if nombre in posiciones_luchadores:
+        avisar_duplicado(nombre, linea, columna, posiciones_luchadores[nombre][0])
+    luchador_actual = Luchador(nombre, 0, 0)
+    tabla_luchadores[nombre] = luchador_actual
+    posiciones_luchadores[nombre] = (linea, columna)
 
 def p_cuerpo(prog):
     """cuerpo : stats bloque_acciones bloque_combos"""
@@ -51,8 +84,7 @@ def p_cuerpo(prog):
 
 def p_stats(prog):
     """stats : STATS PAREN_ABRE HP IGUAL NUMERO COMA ST IGUAL NUMERO PAREN_CIERRA PUNTO_Y_COMA"""
-    nombre = list(tabla_luchadores.keys())[-1]
-    luchador = tabla_luchadores[nombre]
+    luchador = luchador_actual
     luchador.hp = luchador.hp_max = prog[5]
     luchador.st = luchador.st_max = prog[9]
 
@@ -73,12 +105,24 @@ def p_accion(prog):
     """accion : GOLPE DOS_PUNTOS lista_golpes PUNTO_Y_COMA
               | PATADA DOS_PUNTOS lista_golpes PUNTO_Y_COMA
               | BLOQUEO DOS_PUNTOS ID PUNTO_Y_COMA"""
-    nombre_luchador = list(tabla_luchadores.keys())[-1]
-    luchador = tabla_luchadores[nombre_luchador]
+    luchador = luchador_actual
+    tipo = sys.intern(prog[1].lower())
 
-    if prog[1].lower() == "bloqueo":
-        accion = AccionAtomica("bloqueo", prog[3])
+    if tipo == "bloqueo":
+        accion = internar(AccionAtomica("bloqueo", prog[3]), acciones_internadas)
         luchador.acciones[prog[3]] = accion
+    else:
+        for nombre, atributos in prog[3]:
+            accion = AccionAtomica(
+                tipo=tipo,
+                nombre=nombre,
+                danio=atributos.get("danio", 0),
+                costo=atributos.get("costo", 0),
+                altura=atributos.get("altura"),
+                forma=atributos.get("forma"),
+                giratoria=(atributos.get("giratoria", "no") == "si")
+            )
+            luchador.acciones[nombre] = internar(accion, acciones_internadas)
 
 def p_lista_golpes(prog):
     """lista_golpes : golpe
@@ -87,21 +131,8 @@ def p_lista_golpes(prog):
 
 def p_golpe(prog):
     """golpe : ID PAREN_ABRE atributos PAREN_CIERRA"""
-    nombre_luchador = list(tabla_luchadores.keys())[-1]
-    luchador = tabla_luchadores[nombre_luchador]
-    atributos = prog[3]
-
-    accion = AccionAtomica(
-        tipo="golpe",
-        nombre=prog[1],
-        danio=atributos.get("danio", 0),
-        costo=atributos.get("costo", 0),
-        altura=atributos.get("altura"),
-        forma=atributos.get("forma"),
-        giratoria=(atributos.get("giratoria", "no") == "si")
-    )
-    luchador.acciones[prog[1]] = accion
-    prog[0] = accion
+    # La acción se crea en p_accion, que conoce su tipo (golpe o patada)
+    prog[0] = (prog[1], prog[3])
 
 def p_atributos(prog):
     """atributos : atributo
@@ -129,12 +160,12 @@ def p_valor_altura(prog):
     """valor_altura : ALTA
                     | MEDIA
                     | BAJA"""
-    prog[0] = prog[1].lower()
+    prog[0] = sys.intern(prog[1].lower())
 
 def p_valor_forma(prog):
     """valor_forma : FRONTAL
                    | LATERAL"""
-    prog[0] = prog[1].lower()
+    prog[0] = sys.intern(prog[1].lower())
 
 def p_valor_giro(prog):
     """valor_giro : SI
@@ -156,10 +187,9 @@ def p_lista_combos(prog):
 
 def p_combo(prog):
     """combo : ID PAREN_ABRE ST_REQ IGUAL NUMERO PAREN_CIERRA LLAVE_ABRE lista_ids LLAVE_CIERRA"""
-    nombre_luchador = list(tabla_luchadores.keys())[-1]
-    luchador = tabla_luchadores[nombre_luchador]
+    luchador = luchador_actual
     combo = Combo(prog[1], prog[5], prog[8])
-    luchador.combos[prog[1]] = combo
+    luchador.combos[prog[1]] = internar(combo, combos_internados)
 
 def p_lista_ids(prog):
     """lista_ids : ID
@@ -175,8 +205,18 @@ def p_bloque_simulacion(prog):
     prog[0] = Simulacion(prog[3], prog[4])
 
 def p_configuracion(prog):
-    """configuracion : CONFIG LLAVE_ABRE LUCHADORES DOS_PUNTOS ID VS ID PUNTO_Y_COMA INICIA DOS_PUNTOS ID PUNTO_Y_COMA TURNOS_MAX DOS_PUNTOS NUMERO PUNTO_Y_COMA LLAVE_CIERRA"""
-    prog[0] = Configuracion(prog[5], prog[7], prog[11], prog[15])
+    """configuracion : CONFIG LLAVE_ABRE LUCHADORES DOS_PUNTOS lista_vs PUNTO_Y_COMA INICIA DOS_PUNTOS ID PUNTO_Y_COMA TURNOS_MAX DOS_PUNTOS NUMERO PUNTO_Y_COMA LLAVE_CIERRA"""
+    nombres = prog[5]
+    prog[0] = Configuracion(nombres[0], nombres[1], prog[9], prog[13], nombres)
+
+def p_lista_vs(prog):
+    """lista_vs : ID VS ID
+                | lista_vs VS ID"""
+    if isinstance(prog[1], list):
+        prog[1].append(prog[3])
+        prog[0] = prog[1]
+    else:
+        prog[0] = [prog[1], prog[3]]
 
 def p_pelea(prog):
     """pelea : PELEA LLAVE_ABRE lista_turnos LLAVE_CIERRA"""
@@ -230,12 +270,95 @@ def p_operador(prog):
                 | DISTINTO"""
     prog[0] = prog[1]
 
+# --------------------------------------------------------------
+# RECUPERACIÓN DE ERRORES
+# --------------------------------------------------------------
+#  Cada regla con el token especial `error` descarta la entrada
+#  hasta el siguiente ';' o '}' y permite seguir analizando, de
+#  modo que un archivo informa todos sus errores de una pasada.
+
+def p_cabecera_error(prog):
+    """cabecera : LUCHADOR error LLAVE_ABRE"""
+    global luchador_actual
+    # Luchador provisional (no se registra) para absorber el cuerpo
+    luchador_actual = Luchador("?", 0, 0)
+
+def p_definicion_error(prog):
+    """definicion : cabecera error LLAVE_CIERRA
+                  | error LLAVE_CIERRA"""
+    # La segunda forma descarta una '}' suelta entre definiciones
+    pass
+
+def p_stats_error(prog):
+    """stats : STATS error PUNTO_Y_COMA"""
+    pass
+
+def p_bloque_acciones_error(prog):
+    """bloque_acciones : ACCIONES LLAVE_ABRE error LLAVE_CIERRA"""
+    pass
+
+def p_lista_acciones_error(prog):
+    """lista_acciones : accion error"""
+    # Error en la última acción (p. ej. sin ';'): se recupera en la '}'
+    pass
+
+def p_accion_error(prog):
+    """accion : error PUNTO_Y_COMA"""
+    pass
+
+def p_bloque_combos_error(prog):
+    """bloque_combos : COMBOS LLAVE_ABRE error LLAVE_CIERRA"""
+    pass
+
+def p_combo_error(prog):
+    """combo : ID error LLAVE_CIERRA"""
+    pass
+
+def p_configuracion_error(prog):
+    """configuracion : CONFIG error LLAVE_CIERRA"""
+    prog[0] = None
+
+def p_turno_error(prog):
+    """turno : TURNO error LLAVE_CIERRA"""
+    prog[0] = None
+
+def p_lista_instrucciones_error(prog):
+    """lista_instrucciones : error"""
+    # Error justo antes de la '}' del turno o del bloque si/sino
+    prog[0] = []
+
+def p_instruccion_error(prog):
+    """instruccion : error PUNTO_Y_COMA
+                   | SI error LLAVE_CIERRA"""
+    prog[0] = None
+
 # --------------------------------------------------------------
 # MANEJO DE ERRORES
 # --------------------------------------------------------------
 
+def reportar(tipo, linea, columna, mensaje):
+    """Registra un diagnóstico en la lista activa de validación."""
+    diagnosticos.append(Diagnostico(tipo, linea, columna, mensaje))
+
+def avisar_duplicado(nombre, linea, columna, linea_anterior):
+    """Un luchador redefinido reemplaza al anterior, pero se informa."""
+    mensaje = f"luchador '{nombre}' ya definido en la línea {linea_anterior}"
+    if diagnosticos is not None:
+        reportar('semantico', linea, columna, mensaje)
+    else:
+        print(f" Aviso: {mensaje} (línea {linea})")
+
 def p_error(prog):
-    if prog:
+    if diagnosticos is not None:
+        if prog:
+            reportar('sintactico', prog.lineno,
+                     calcular_columna(prog.lexer.lexdata, prog.lexpos),
+                     f"token inesperado '{prog.value}'")
+        else:
+            reportar('sintactico', _lexer_validacion.lineno,
+                     calcular_columna(_lexer_validacion.lexdata, len(_lexer_validacion.lexdata)),
+                     FIN_INESPERADO)
+    elif prog:
         print(f" Error de sintaxis en '{prog.value}' (línea {prog.lineno})")
     else:
         print(" Error de sintaxis al final del archivo")
@@ -244,12 +367,90 @@ def p_error(prog):
 # CONSTRUCCIÓN DEL PARSER
 # --------------------------------------------------------------
 
-def construir_parser():
+def construir_parser(inicio='programa'):
+    """
+    Construye el parser. Con otro símbolo inicial (p. ej. 'definiciones'
+    o 'bloque_simulacion', para analizar fragmentos sueltos) las tablas
+    se generan en memoria y no reemplazan a parsetab.py.
+    """
     lexer = construir_lexer()
-    parser = yacc.yacc(start='programa', debug=False)
+    if inicio == 'programa':
+        parser = yacc.yacc(start='programa', debug=False)
+    else:
+        parser = yacc.yacc(start=inicio, debug=False, write_tables=False,
+                           errorlog=yacc.NullLogger())
+    reducir_por_defecto(parser)
     return parser
 
+def reducir_por_defecto(parser):
+    """
+    En los estados cuyas acciones son todas la misma reducción, reduce
+    sin mirar el siguiente token (PLY solo lo hace si la reducción tiene
+    un único token posible). Así una construcción completa, como un
+    combo `... { a, b }`, se reduce antes de detectar un error en lo que
+    sigue, y la recuperación no vuelve a entrar en ella tragándose la
+    '}' del bloque que la contiene. Con entradas válidas el resultado
+    no cambia.
+    """
+    for estado, acciones in parser.action.items():
+        reglas = set(acciones.values())
+        if len(reglas) == 1:
+            regla = reglas.pop()
+            if regla < 0:
+                parser.defaulted_states[estado] = regla
+
 def parsear(texto):
+    global luchador_actual
     tabla_luchadores.clear()
+    posiciones_luchadores.clear()
+    luchador_actual = None
     parser = construir_parser()
     return parser.parse(texto, lexer=construir_lexer())
+
+# --------------------------------------------------------------
+# ANÁLISIS CON RECOLECCIÓN DE DIAGNÓSTICOS
+# --------------------------------------------------------------
+
+_lexer_validacion = None
+
+def analizar_fragmento(texto, parser, lexer, linea=1):
+    """
+    Analiza `texto` con `parser` (cualquier símbolo inicial) sin imprimir
+    nada, contando las líneas desde `linea`. Devuelve (resultado,
+    luchadores, posiciones, diagnosticos), donde luchadores y posiciones
+    son los luchadores definidos en el fragmento y dónde se definieron.
+    """
+    global diagnosticos, luchador_actual, _lexer_validacion
+    tabla_luchadores.clear()
+    posiciones_luchadores.clear()
+    luchador_actual = None
+    encontrados = []
+    lexer.lineno = linea
+    lexer.reportar = reportar
+    diagnosticos = encontrados
+    _lexer_validacion = lexer
+    try:
+        resultado = parser.parse(texto, lexer=lexer)
+    finally:
+        diagnosticos = None
+        _lexer_validacion = None
+        del lexer.reportar
+    return resultado, dict(tabla_luchadores), dict(posiciones_luchadores), encontrados
+
+def analizar(texto, parser=None, lexer=None):
+    """
+    Analiza `texto` sin imprimir nada y devuelve (programa, diagnosticos).
+    El programa es None si el archivo no pudo reconstruirse completo.
+    Se pueden pasar un parser y un lexer ya construidos para reutilizarlos
+    entre muchos archivos.
+    """
+    if parser is None:
+        parser = construir_parser()
+    if lexer is None:
+        lexer = construir_lexer()
+
+    programa, _, _, encontrados = analizar_fragmento(texto, parser, lexer)
+    if encontrados:
+        encontrados.sort(key=lambda d: (d.linea, d.columna))
+        programa = None
+    return programa, encontrados
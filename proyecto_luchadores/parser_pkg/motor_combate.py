@@ -8,27 +8,97 @@
 #  Mantenerlo separado clarifica la responsabilidad de cada parte:
 #    - interprete.parsear(...) construye el árbol del programa.
 #    - motor_combate.ejecutar(...) interpreta y simula el combate.
+#  Las herramientas que simulan muchos combates (torneos,
+#  balanceo, etc.) usan pelear(...) / enfrentar(...), que no
+#  imprimen nada y devuelven un Resultado.
 # ==============================================================
 
 from parser_pkg.gramatica import Usar, SiSino
 
 
+def _silencio(*args, **kwargs):
+    """Registro vacío: descarta los mensajes del combate."""
+
+
+class Resultado:
+    """
+    Estado final de un combate: HP y ST de cada luchador,
+    turnos jugados y ganador (None si hay empate).
+    """
+    def __init__(self, luch1, luch2, hp1, st1, hp2, st2, turnos):
+        self.luch1 = luch1
+        self.luch2 = luch2
+        self.hp1 = hp1
+        self.st1 = st1
+        self.hp2 = hp2
+        self.st2 = st2
+        self.turnos = turnos
+
+    @property
+    def ganador(self):
+        if self.hp1 > self.hp2:
+            return self.luch1
+        if self.hp2 > self.hp1:
+            return self.luch2
+        return None
+
+    def como_tupla(self):
+        return (self.hp1, self.st1, self.hp2, self.st2, self.turnos)
+
+    def __eq__(self, otro):
+        return (isinstance(otro, Resultado)
+                and (self.luch1, self.luch2) == (otro.luch1, otro.luch2)
+                and self.como_tupla() == otro.como_tupla())
+
+    def __repr__(self):
+        return (f"<Resultado {self.luch1} HP={self.hp1} ST={self.st1} vs "
+                f"{self.luch2} HP={self.hp2} ST={self.st2} turnos={self.turnos}>")
+
+
 def ejecutar(programa):
-    """Ejecuta la simulación descrita en el objeto Programa."""
+    """
+    Ejecuta la simulación descrita en el objeto Programa. Con más de
+    dos luchadores en la configuración es una batalla campal.
+    """
     sim = programa.simulacion
+    if len(sim.config.luchadores) > 2:
+        from parser_pkg.batalla_campal import ejecutar_campal
+        return ejecutar_campal(programa)
     l1 = programa.luchadores[sim.config.luch1].clonar()
     l2 = programa.luchadores[sim.config.luch2].clonar()
 
-    turnos = {t.luchador: t for t in sim.turnos}
-    orden = [
-        sim.config.inicia,
-        sim.config.luch1 if sim.config.inicia != sim.config.luch1 else sim.config.luch2,
-    ]
+    turnos = {t.luchador: t.acciones for t in sim.turnos}
 
     print(f"\n  COMBATE: {l1.nombre} vs {l2.nombre}")
     print(f"Turnos máximos: {sim.config.turnos}\n")
 
-    for t in range(sim.config.turnos):
+    resultado = pelear(l1, l2, turnos, sim.config.inicia, sim.config.turnos, log=print)
+
+    print("\n RESULTADO FINAL:")
+    print(f"{l1.nombre}: HP={l1.hp}, ST={l1.st}")
+    print(f"{l2.nombre}: HP={l2.hp}, ST={l2.st}")
+    if l1.hp > l2.hp:
+        print(f" Gana {l1.nombre}")
+    elif l2.hp > l1.hp:
+        print(f" Gana {l2.nombre}")
+    else:
+        print(" Empate")
+    return resultado
+
+
+def pelear(l1, l2, turnos, inicia, turnos_max, log=_silencio):
+    """
+    Simula el combate entre dos luchadores ya clonados.
+    `turnos` asocia el nombre de cada luchador con su lista de
+    instrucciones. Modifica el HP/ST de l1 y l2 y devuelve un Resultado.
+    """
+    orden = [
+        inicia,
+        l1.nombre if inicia != l1.nombre else l2.nombre,
+    ]
+
+    jugados = turnos_max
+    for t in range(turnos_max):
         for quien in orden:
             yo = l1 if quien == l1.nombre else l2
             rival = l2 if yo == l1 else l1
@@ -36,61 +106,88 @@ def ejecutar(programa):
             if quien not in turnos:
                 continue
 
-            print(f"  Turno {t + 1} de {yo.nombre}:")
-            ejecutar_turno(turnos[quien].acciones, yo, rival)
+            log(f"  Turno {t + 1} de {yo.nombre}:")
+            ejecutar_turno(turnos[quien], yo, rival, log)
 
             if l1.hp <= 0 or l2.hp <= 0:
                 break
         if l1.hp <= 0 or l2.hp <= 0:
+            jugados = t + 1
             break
 
-    print("\n RESULTADO FINAL:")
-    print(f"{l1.nombre}: HP={l1.hp}, ST={l1.st}")
-    print(f"{l2.nombre}: HP={l2.hp}, ST={l2.st}")
-    if l1.hp > l2.hp:
-        print(f" Gana {l1.nombre}")
-    elif l2.hp > l1.hp:
-        print(f" Gana {l2.nombre}")
-    else:
-        print(" Empate")
+    return Resultado(l1.nombre, l2.nombre, l1.hp, l1.st, l2.hp, l2.st, jugados)
+
+
+def guion_de(programa, nombre):
+    """
+    Devuelve las instrucciones del turno de `nombre` en el bloque pelea.
+    Si el luchador no tiene turno definido usa su primer combo (o, sin
+    combos, su primera acción ofensiva) en cada turno.
+    """
+    for turno in programa.simulacion.turnos:
+        if turno.luchador == nombre:
+            return turno.acciones
+    luchador = programa.luchadores[nombre]
+    for combo in luchador.combos:
+        return [Usar(combo)]
+    for accion in luchador.acciones.values():
+        if accion.tipo != "bloqueo":
+            return [Usar(accion.nombre)]
+    return []
+
+
+def enfrentar(programa, nombre1, nombre2, inicia=None, turnos_max=None, motor=pelear):
+    """
+    Simula en silencio un combate entre dos luchadores de la biblioteca
+    usando el guion de cada uno. Por defecto inicia `nombre1` y se usan
+    los turnos máximos de la configuración del programa. `motor` puede
+    ser cualquier función con la firma de pelear (p. ej. forma_cerrada.resolver).
+    """
+    l1 = programa.luchadores[nombre1].clonar()
+    l2 = programa.luchadores[nombre2].clonar()
+    turnos = {nombre1: guion_de(programa, nombre1),
+              nombre2: guion_de(programa, nombre2)}
+    if turnos_max is None:
+        turnos_max = programa.simulacion.config.turnos
+    return motor(l1, l2, turnos, inicia or nombre1, turnos_max)
 
 
-def ejecutar_turno(lista, yo, rival):
+def ejecutar_turno(lista, yo, rival, log=_silencio):
     """Procesa las instrucciones de un turno para un luchador."""
     for instr in lista:
         if isinstance(instr, Usar):
-            aplicar_accion(instr.nombre, yo, rival)
+            aplicar_accion(instr.nombre, yo, rival, log)
         elif isinstance(instr, SiSino):
             if instr.condicion.evaluar(yo, rival):
-                ejecutar_turno(instr.bloque_si, yo, rival)
+                ejecutar_turno(instr.bloque_si, yo, rival, log)
             else:
-                ejecutar_turno(instr.bloque_sino, yo, rival)
+                ejecutar_turno(instr.bloque_sino, yo, rival, log)
 
 
-def aplicar_accion(nombre, yo, rival):
+def aplicar_accion(nombre, yo, rival, log=_silencio):
     """Ejecuta una acción o combo y actualiza los estados."""
     if nombre in yo.combos:
         combo = yo.combos[nombre]
         if yo.st >= combo.st_req:
             yo.st -= combo.st_req
-            print(f" {yo.nombre} ejecuta combo {nombre}")
+            log(f" {yo.nombre} ejecuta combo {nombre}")
             for act in combo.acciones:
-                aplicar_accion(act, yo, rival)
+                aplicar_accion(act, yo, rival, log)
         else:
             primero = combo.acciones[0]
-            print(f" {yo.nombre} no tiene ST suficiente, usa {primero} en su lugar")
-            aplicar_accion(primero, yo, rival)
+            log(f" {yo.nombre} no tiene ST suficiente, usa {primero} en su lugar")
+            aplicar_accion(primero, yo, rival, log)
     elif nombre in yo.acciones:
         accion = yo.acciones[nombre]
         if accion.tipo == "bloqueo":
-            print(f" {yo.nombre} usa {nombre} (bloqueo)")
+            log(f" {yo.nombre} usa {nombre} (bloqueo)")
             return
         if yo.st < accion.costo:
-            print(f" {yo.nombre} no tiene suficiente ST ({yo.st}/{accion.costo})")
+            log(f" {yo.nombre} no tiene suficiente ST ({yo.st}/{accion.costo})")
             return
         yo.st -= accion.costo
         rival.hp -= accion.daño
         rival.hp = max(0, rival.hp)
-        print(f" {yo.nombre} usa {nombre} (-{accion.daño} HP al rival)")
+        log(f" {yo.nombre} usa {nombre} (-{accion.daño} HP al rival)")
     else:
-        print(f" Acción '{nombre}' no existe para {yo.nombre}")
+        log(f" Acción '{nombre}' no existe para {yo.nombre}")
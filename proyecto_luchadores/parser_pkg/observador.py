@@ -0,0 +1,461 @@
+# ==============================================================
+#  parser_pkg/observador.py
+# ==============================================================
+#  MODO OBSERVADOR: RE-ANÁLISIS Y RE-SIMULACIÓN INCREMENTAL
+# --------------------------------------------------------------
+#  Vigila uno o más archivos de luchadores (consultando su fecha
+#  de modificación) y, cada vez que uno cambia:
+#   - compara el texto con la versión anterior y vuelve a dividir
+#     en bloques (con el pre-escaneo de parseo_paralelo) solo el
+#     tramo que cambió; de cada bloque de ese tramo se calcula una
+#     huella y solo se analizan los que no se habían visto;
+#   - vuelve a simular el combate de la simulación solo si cambió
+#     alguno de sus luchadores o el bloque `simulacion`;
+#   - con --torneo, mantiene la tabla todos contra todos y solo
+#     simula los combates en los que participa un luchador
+#     modificado (con el almacén de almacen_resultados, así que
+#     con --db los resultados sobreviven entre sesiones).
+#  Si el archivo no tiene la forma de una biblioteca, o tiene
+#  errores, se analiza entero con interprete.analizar y se
+#  informan sus diagnósticos.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m parser_pkg.observador ejemplos/ --torneo
+# ==============================================================
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from bisect import bisect_left, bisect_right
+
+from parser_pkg.almacen_resultados import (AlmacenResultados, clave_combate, huella_guion,
+                                           huella_luchador, simular_pendientes)
+from parser_pkg.batalla_campal import ResultadoCampal, guiones_campal, pelear_campal
+from parser_pkg.gramatica import Programa
+from parser_pkg.interprete import analizar
+from parser_pkg.motor_combate import guion_de, pelear
+from parser_pkg.parseo_paralelo import analizar_bloque, dividir_bloques, es_biblioteca
+from parser_pkg.validador import expandir_rutas
+
+# --------------------------------------------------------------
+# ANÁLISIS INCREMENTAL
+# --------------------------------------------------------------
+
+# Tamaño de los tramos con que se comparan dos versiones del texto
+TAM_COMPARACION = 1 << 14
+
+def _prefijo_comun(a, b):
+    """Largo del prefijo común de dos textos (comparando por tramos)."""
+    limite = min(len(a), len(b))
+    i = 0
+    while i < limite:
+        paso = min(TAM_COMPARACION, limite - i)
+        if a[i:i + paso] != b[i:i + paso]:
+            break
+        i += paso
+    else:
+        return limite
+    while a[i] == b[i]:
+        i += 1
+    return i
+
+def _sufijo_comun(a, b, maximo):
+    """Largo del sufijo común de dos textos, sin pasar de `maximo`."""
+    fin_a, fin_b = len(a), len(b)
+    i = 0
+    while i < maximo:
+        paso = min(TAM_COMPARACION, maximo - i)
+        if a[fin_a - i - paso:fin_a - i] != b[fin_b - i - paso:fin_b - i]:
+            break
+        i += paso
+    else:
+        return maximo
+    while a[fin_a - i - 1] == b[fin_b - i - 1]:
+        i += 1
+    return i
+
+
+class BibliotecaIncremental:
+    """
+    Analiza versiones sucesivas de un mismo archivo reutilizando lo
+    que no cambió:
+      - el texto nuevo se compara con el anterior y solo se vuelve a
+        pre-escanear el tramo de bloques que contiene los cambios; los
+        bloques anteriores y posteriores se conservan (desplazando sus
+        líneas);
+      - cada bloque del tramo se identifica por la huella de su texto,
+        y solo se analiza si esa huella no se había visto (un bloque
+        que solo se movió no se vuelve a analizar).
+    Si algún bloque tiene errores, o hay luchadores repetidos, los
+    diagnósticos se obtienen analizando el archivo entero con
+    interprete.analizar, así que son exactamente los mismos.
+    """
+    def __init__(self):
+        self._texto = None     # última versión analizada sin errores
+        self._programa = None
+        self._fines = []       # posición donde termina cada fragmento
+        self._tipos = []       # 'luchador' o 'simulacion'
+        self._datos = []       # (resultado, luchadores) de cada fragmento
+        self._huellas = []
+        self._cache = {}       # huella -> datos de bloques sin errores
+
+    def actualizar(self, texto):
+        """
+        Devuelve (programa, diagnosticos, reanalizados), donde
+        reanalizados es la cantidad de bloques analizados de nuevo
+        (None si hubo que analizar el archivo entero).
+        """
+        if self._texto is not None:
+            if texto == self._texto:
+                return self._programa, [], 0
+            salida = self._actualizar_tramo(texto)
+            if salida is not None:
+                return salida
+        return self._actualizar_todo(texto)
+
+    def _analizar(self, texto, fragmentos, tipos):
+        """Analiza (o toma de la caché) los fragmentos indicados."""
+        inicios = ["definiciones" if t == "luchador" else "bloque_simulacion" for t in tipos]
+        datos, huellas, errores, reanalizados = [], [], False, 0
+        for (desde, hasta), inicio in zip(fragmentos, inicios):
+            fragmento = texto[desde:hasta]
+            huella = hashlib.blake2b(fragmento.encode("utf-8"), digest_size=16).digest()
+            guardado = self._cache.get(huella)
+            if guardado is None:
+                # La posición no importa: los diagnósticos salen de analizar
+                resultado, luchadores, _, diagnosticos = analizar_bloque((fragmento, 1, 1, inicio))
+                reanalizados += 1
+                guardado = (resultado, luchadores)
+                if diagnosticos:
+                    errores = True
+                else:
+                    self._cache[huella] = guardado
+            datos.append(guardado)
+            huellas.append(huella)
+        return datos, huellas, errores, reanalizados
+
+    def _actualizar_todo(self, texto):
+        bloques = dividir_bloques(texto)
+        if not es_biblioteca(bloques):
+            self._texto = None
+            programa, diagnosticos = analizar(texto)
+            return programa, diagnosticos, None
+        tipos = [tipo for tipo, _ in bloques]
+        fines = [fin for _, fin in bloques]
+        fines[-1] = len(texto)
+        fragmentos = list(zip([0] + fines[:-1], fines))
+        datos, huellas, errores, reanalizados = self._analizar(texto, fragmentos, tipos)
+        self._fines, self._tipos, self._datos, self._huellas = fines, tipos, datos, huellas
+        return (*self._unir(texto, errores), reanalizados)
+
+    def _actualizar_tramo(self, texto):
+        """
+        Vuelve a escanear solo los fragmentos que tocan la zona
+        modificada. Devuelve None si el tramo no se puede aislar.
+        """
+        viejo, fines, n = self._texto, self._fines, len(self._fines)
+        prefijo = _prefijo_comun(viejo, texto)
+        sufijo = _sufijo_comun(viejo, texto, min(len(viejo), len(texto)) - prefijo)
+        delta = len(texto) - len(viejo)
+
+        # Fragmentos [k1, k2) del texto viejo que contienen los cambios
+        k1 = min(bisect_right(fines, prefijo), n - 1)
+        limite = len(viejo) - sufijo
+        k2 = max(k1, bisect_left(fines, limite) + 1 if limite > 0 else 0)
+        k2 = min(k2, n)
+        a = fines[k1 - 1] if k1 > 0 else 0
+        b = fines[k2 - 1] + delta if k2 < n else len(texto)
+
+        medio = dividir_bloques(texto[a:b])
+        if medio is None:
+            return None
+        tipos = self._tipos[:k1] + [tipo for tipo, _ in medio] + self._tipos[k2:]
+        if len(tipos) < 2 or tipos[-1] != "simulacion" or tipos.count("simulacion") != 1:
+            return None
+        fines_medio = [a + fin for _, fin in medio]
+        if k2 < n:
+            # El tramo debe terminar justo al cerrar su último bloque
+            if (fines_medio[-1] if fines_medio else a) != b:
+                return None
+        else:
+            fines_medio[-1] = len(texto)
+
+        fragmentos = list(zip([a] + fines_medio[:-1], fines_medio))
+        datos, huellas, errores, reanalizados = \
+            self._analizar(texto, fragmentos, [tipo for tipo, _ in medio])
+
+        self._fines = fines[:k1] + fines_medio + [fin + delta for fin in fines[k2:]]
+        self._tipos = tipos
+        self._datos = self._datos[:k1] + datos + self._datos[k2:]
+        self._huellas = self._huellas[:k1] + huellas + self._huellas[k2:]
+        return (*self._unir(texto, errores), reanalizados)
+
+    def _unir(self, texto, errores):
+        """Arma el Programa con los datos de todos los fragmentos."""
+        luchadores, total = {}, 0
+        for _, definidos in self._datos:
+            luchadores.update(definidos)
+            total += len(definidos)
+
+        if errores or len(luchadores) != total:
+            # Un fragmento suelto se recupera de los errores de otra
+            # forma que el archivo completo: se analiza todo de nuevo.
+            self._texto = self._programa = None
+            programa, diagnosticos = analizar(texto)
+            return programa, diagnosticos
+
+        # Se descartan de la caché los bloques que ya no están
+        if len(self._cache) > 2 * len(self._huellas) + 64:
+            actuales = set(self._huellas)
+            self._cache = {h: d for h, d in self._cache.items() if h in actuales}
+        self._texto = texto
+        self._programa = Programa(luchadores, self._datos[-1][0])
+        return self._programa, []
+
+
+# --------------------------------------------------------------
+# RE-SIMULACIÓN INCREMENTAL
+# --------------------------------------------------------------
+
+def _contar(tabla, a, b, margen, signo):
+    """
+    Suma (o resta, con signo -1) a la tabla de posiciones el combate en
+    que `a` inicia contra `b`, con `margen` = HP de a - HP de b al final.
+    """
+    if margen == 0:
+        tabla[a][1] += signo
+        tabla[b][1] += signo
+    else:
+        ganador, perdedor = (a, b) if margen > 0 else (b, a)
+        tabla[ganador][0] += signo
+        tabla[perdedor][2] += signo
+
+
+class TorneoIncremental:
+    """
+    Resultados del todos contra todos de una biblioteca que va
+    cambiando. Cada luchador tiene una firma (huella de su definición
+    y de su guion); al actualizar solo se simulan los combates de los
+    luchadores cuya firma cambió, y la tabla de posiciones se corrige
+    restando los resultados viejos y sumando los nuevos.
+    """
+    def __init__(self, almacen, procesos=1):
+        self.almacen = almacen
+        self.procesos = procesos
+        # inicia -> {rival -> margen de HP}; enteros y no objetos
+        # Resultado, para que el recolector de basura no tenga que
+        # recorrer un objeto por combate en cada pasada completa
+        self.resultados = {}
+        self.tabla = {}           # nombre -> [victorias, empates, derrotas]
+        self._firmas = {}         # nombre -> (huella, guion)
+        self._huellas = {}        # id(luchador) -> (luchador, simulacion, huella, guion)
+        self._turnos_max = None
+
+    def _firma(self, programa, nombre, huellas):
+        """Firma de un luchador; solo se recalcula si cambió su objeto o la simulación."""
+        luchador = programa.luchadores[nombre]
+        guardada = self._huellas.get(id(luchador))
+        if guardada is None or guardada[0] is not luchador:
+            guardada = (luchador, None, huella_luchador(luchador), None)
+        if guardada[1] is not programa.simulacion:
+            # El guion sale del bloque simulacion (o, sin turno, de la definición)
+            guardada = (luchador, programa.simulacion, guardada[2],
+                        huella_guion(guion_de(programa, nombre)))
+        huellas[id(luchador)] = guardada
+        return guardada[2], guardada[3]
+
+    def actualizar(self, programa):
+        """Pone al día los resultados. Devuelve (cambiados, simulados)."""
+        turnos_max = programa.simulacion.config.turnos
+        huellas = {}
+        firmas = {n: self._firma(programa, n, huellas) for n in programa.luchadores}
+        self._huellas = huellas
+
+        if turnos_max != self._turnos_max:
+            cambiados = set(firmas)
+        else:
+            cambiados = {n for n, f in firmas.items() if self._firmas.get(n) != f}
+        borrados = set(self._firmas) - set(firmas)
+        self._firmas, self._turnos_max = firmas, turnos_max
+
+        for nombre in borrados:
+            for rival, margen in self.resultados.pop(nombre, {}).items():
+                _contar(self.tabla, nombre, rival, margen, -1)
+            for inicia, fila in self.resultados.items():
+                margen = fila.pop(nombre, None)
+                if margen is not None:
+                    _contar(self.tabla, inicia, nombre, margen, -1)
+            del self.tabla[nombre]
+        if not cambiados:
+            return cambiados, 0
+
+        pares = []
+        for a in cambiados:
+            for b in firmas:
+                if a != b:
+                    pares.append((a, b))
+                    if b not in cambiados:   # si no, lo agrega el recorrido de b
+                        pares.append((b, a))
+        claves = [clave_combate(*firmas[a], *firmas[b], turnos_max) for a, b in pares]
+        conocidos, simulados = simular_pendientes(programa, pares, claves,
+                                                  self.almacen, self.procesos)
+
+        for nombre in cambiados:
+            self.tabla.setdefault(nombre, [0, 0, 0])
+        for (a, b), clave in zip(pares, claves):
+            fila = self.resultados.setdefault(a, {})
+            anterior = fila.get(b)
+            if anterior is not None:
+                _contar(self.tabla, a, b, anterior, -1)
+            hp1, _, hp2, _, _ = conocidos[clave]
+            fila[b] = hp1 - hp2
+            _contar(self.tabla, a, b, hp1 - hp2, 1)
+        return cambiados, simulados
+
+    def posiciones(self, top=None):
+        """[(nombre, victorias, empates, derrotas)] ordenada como tabla_posiciones."""
+        filas = sorted(((n, *v) for n, v in self.tabla.items()),
+                       key=lambda fila: (-(2 * fila[1] + fila[2]), fila[0]))
+        return filas[:top] if top is not None else filas
+
+# --------------------------------------------------------------
+# ESTADO DE CADA ARCHIVO
+# --------------------------------------------------------------
+
+class ArchivoObservado:
+    """Versión analizada de un archivo y lo necesario para actualizarla."""
+    def __init__(self, ruta, almacen=None, procesos=1):
+        self.ruta = ruta
+        self.marca = None
+        self.biblioteca = BibliotecaIncremental()
+        self.torneo = TorneoIncremental(almacen, procesos) if almacen is not None else None
+        self.combate = None
+        self._firma_combate = None
+        self.con_errores = False    # la última revisión no pudo actualizar el análisis
+
+    def _simular_combate(self, programa):
+        """Vuelve a simular el combate de la simulación solo si cambió algo que lo afecta."""
+        sim = programa.simulacion
+        config = sim.config
+        luchadores = [programa.luchadores.get(nombre) for nombre in config.luchadores]
+        firma = (sim, *luchadores)
+        if any(l is None for l in luchadores):
+            self.combate, self._firma_combate = None, None
+            return False
+        if (self._firma_combate is not None and len(firma) == len(self._firma_combate)
+                and all(x is y for x, y in zip(firma, self._firma_combate))):
+            return False
+        if len(luchadores) > 2:
+            self.combate = pelear_campal([l.clonar() for l in luchadores],
+                                         guiones_campal(programa), config.inicia, config.turnos)
+        else:
+            l1, l2 = luchadores
+            turnos = {t.luchador: t.acciones for t in sim.turnos}
+            self.combate = pelear(l1.clonar(), l2.clonar(), turnos, config.inicia, config.turnos)
+        self._firma_combate = firma
+        return True
+
+    def revisar(self):
+        """
+        Si el archivo cambió desde la última revisión lo actualiza y
+        devuelve un informe (lista de líneas); si no, devuelve None.
+        """
+        try:
+            estado = os.stat(self.ruta)
+            marca = (estado.st_mtime_ns, estado.st_size)
+            if marca == self.marca:
+                return None
+            self.marca = marca
+            with open(self.ruta, "r", encoding="utf-8") as f:
+                texto = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            if self.marca == "error":
+                return None
+            self.marca = "error"
+            self.con_errores = True
+            return [f"{self.ruta}: no se pudo leer ({e})"]
+
+        inicio = time.perf_counter()
+        programa, diagnosticos, reanalizados = self.biblioteca.actualizar(texto)
+        self.con_errores = bool(diagnosticos)
+        if diagnosticos:
+            return [f"{self.ruta}:{d}" for d in diagnosticos]
+
+        informe = []
+        combate = self._simular_combate(programa)
+        cambiados, simulados = (self.torneo.actualizar(programa)
+                                if self.torneo is not None else ((), 0))
+        duracion = (time.perf_counter() - inicio) * 1000
+
+        bloques = "archivo completo" if reanalizados is None else f"{reanalizados} bloques"
+        informe.append(f"{self.ruta}: {bloques} re-analizados, "
+                       f"{simulados + combate} combates simulados ({duracion:.0f} ms)")
+        if isinstance(self.combate, ResultadoCampal):
+            r = self.combate
+            ganador = f"gana {r.ganador}" if r.ganador else "empate"
+            informe.append(f"  batalla campal de {len(r.nombres)}: {ganador} "
+                           f"({len(r.eliminados)} eliminados, {r.turnos} turnos)")
+        elif self.combate is not None:
+            r = self.combate
+            ganador = f"gana {r.ganador}" if r.ganador else "empate"
+            informe.append(f"  {r.luch1} vs {r.luch2}: {ganador} "
+                           f"(HP {r.hp1} / {r.hp2}, {r.turnos} turnos)")
+        if self.torneo is not None and cambiados:
+            informe.append(f"  luchadores modificados: {len(cambiados)}")
+        return informe
+
+# --------------------------------------------------------------
+# BUCLE PRINCIPAL
+# --------------------------------------------------------------
+
+def observar(archivos, intervalo=0.05, top=5, log=print, vueltas=None):
+    """
+    Revisa los ArchivoObservado cada `intervalo` segundos e imprime
+    el informe de los que cambian (con las `top` primeras posiciones
+    del torneo, salvo que el archivo tenga errores: serían las de la
+    versión anterior). `vueltas` limita las revisiones (None = hasta Ctrl+C).
+    """
+    vuelta = 0
+    while vueltas is None or vuelta < vueltas:
+        for archivo in archivos:
+            informe = archivo.revisar()
+            if informe is not None:
+                log(f"[{time.strftime('%H:%M:%S')}] " + "\n".join(informe))
+                if archivo.torneo is not None and not archivo.con_errores:
+                    for pos, (nombre, g, e, p) in enumerate(archivo.torneo.posiciones(top), 1):
+                        log(f"{pos:>6}. {nombre:<20} G={g} E={e} P={p}")
+        vuelta += 1
+        time.sleep(intervalo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Vuelve a analizar y simular los archivos de luchadores al editarlos.")
+    parser.add_argument("rutas", nargs="+", help="archivos o carpetas (*.txt) a vigilar")
+    parser.add_argument("--intervalo", type=float, default=0.05,
+                        help="segundos entre revisiones")
+    parser.add_argument("--torneo", action="store_true",
+                        help="mantener también el todos contra todos de cada archivo")
+    parser.add_argument("--db", default=":memory:",
+                        help="base SQLite para los resultados del torneo")
+    parser.add_argument("-j", "--procesos", type=int, default=1)
+    parser.add_argument("--top", type=int, default=5, help="posiciones a mostrar")
+    args = parser.parse_args(argv)
+
+    almacen = AlmacenResultados(args.db) if args.torneo else None
+    archivos = [ArchivoObservado(str(ruta), almacen, args.procesos)
+                for ruta in expandir_rutas(args.rutas)]
+    print(f"Observando {len(archivos)} archivos (Ctrl+C para salir)")
+    try:
+        observar(archivos, args.intervalo, args.top)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if almacen is not None:
+            almacen.cerrar()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
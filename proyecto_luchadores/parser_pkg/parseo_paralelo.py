@@ -0,0 +1,213 @@
+# ==============================================================
+#  parser_pkg/parseo_paralelo.py
+# ==============================================================
+#  ANÁLISIS EN PARALELO DE BIBLIOTECAS GRANDES
+# --------------------------------------------------------------
+#  Los bloques `luchador NOMBRE { ... }` de primer nivel son
+#  independientes entre sí. Un pre-escaneo rápido (solo llaves y
+#  comentarios `//`) localiza dónde termina cada bloque; el texto
+#  se corta en esos puntos en fragmentos que un pool de procesos
+#  analiza con parsers cuyo símbolo inicial es `definiciones` (o
+#  `bloque_simulacion` para el bloque final). Luego se unen los
+#  luchadores en un único Programa:
+#   - cada fragmento cuenta las líneas desde donde empieza y se
+#     rellena con espacios hasta su columna, así que los
+#     diagnósticos indican la misma posición que en el análisis
+#     secuencial;
+#   - los nombres repetidos se informan, en orden de aparición,
+#     en la definición posterior, que reemplaza a la anterior
+#     (igual que interprete.analizar).
+#  Si el archivo no tiene la forma esperada (texto suelto entre
+#  bloques, llaves desbalanceadas, ninguna o varias simulaciones)
+#  o un fragmento termina a mitad de una regla, se usa el análisis
+#  secuencial, que informa esos errores.
+# ==============================================================
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from lexer.tokens import construir_lexer
+from parser_pkg.gramatica import Diagnostico, Programa
+from parser_pkg.interprete import (FIN_INESPERADO, acciones_internadas, analizar,
+                                   analizar_fragmento, combos_internados, construir_parser,
+                                   internar)
+
+# Tamaño mínimo (en caracteres) de un fragmento: por debajo de esto
+# el coste de enviar el trabajo a otro proceso no compensa.
+TAM_MINIMO = 1 << 18
+
+_LLAVE_O_COMENTARIO = re.compile(r"//[^\n]*|[{}]")
+_COMENTARIO = re.compile(r"//[^\n]*")
+_CABECERA = re.compile(
+    r"\s*(?:(luchador)\s+[A-Za-z_áéíóúÁÉÍÓÚñÑ][A-Za-z0-9_áéíóúÁÉÍÓÚñÑ]*|(simulacion))\s*",
+    re.IGNORECASE)
+
+# --------------------------------------------------------------
+# PRE-ESCANEO
+# --------------------------------------------------------------
+
+def dividir_bloques(texto):
+    """
+    Devuelve la lista [(tipo, fin)] de los bloques de primer nivel, con
+    tipo 'luchador' o 'simulacion' y `fin` la posición siguiente a su
+    llave de cierre. Cada bloque empieza donde termina el anterior (el
+    primero en 0). Devuelve None si entre bloques hay algo distinto de
+    una cabecera válida, espacios o comentarios, o si las llaves no
+    están balanceadas.
+    """
+    bloques = []
+    profundidad = 0
+    inicio = 0       # fin del bloque anterior
+    tipo = None
+    for marca in _LLAVE_O_COMENTARIO.finditer(texto):
+        simbolo = marca.group()
+        if simbolo == "{":
+            if profundidad == 0:
+                cabecera = _COMENTARIO.sub("", texto[inicio:marca.start()])
+                reconocida = _CABECERA.fullmatch(cabecera)
+                if reconocida is None:
+                    return None
+                tipo = "luchador" if reconocida.group(1) else "simulacion"
+            profundidad += 1
+        elif simbolo == "}":
+            profundidad -= 1
+            if profundidad < 0:
+                return None
+            if profundidad == 0:
+                inicio = marca.end()
+                bloques.append((tipo, inicio))
+    if profundidad != 0 or _COMENTARIO.sub("", texto[inicio:]).strip():
+        return None
+    return bloques
+
+
+def es_biblioteca(bloques):
+    """Indica si los bloques son uno o más luchadores seguidos de la simulación."""
+    return (bloques is not None and len(bloques) >= 2 and bloques[-1][0] == "simulacion"
+            and all(tipo == "luchador" for tipo, _ in bloques[:-1]))
+
+
+def agrupar_fragmentos(bloques, tam_objetivo):
+    """
+    Agrupa los bloques de luchadores consecutivos en fragmentos de al
+    menos `tam_objetivo` caracteres. Devuelve [(inicio, fin)].
+    """
+    fragmentos = []
+    inicio = 0
+    for _, fin in bloques:
+        if fin - inicio >= tam_objetivo:
+            fragmentos.append((inicio, fin))
+            inicio = fin
+    if bloques and inicio < bloques[-1][1]:
+        fragmentos.append((inicio, bloques[-1][1]))
+    return fragmentos
+
+# --------------------------------------------------------------
+# PARSERS POR PROCESO
+# --------------------------------------------------------------
+
+_parsers = None
+_lexer = None
+
+def _preparar():
+    """Construye (una vez) los parsers de fragmentos de este proceso."""
+    global _parsers, _lexer
+    if _parsers is None:
+        _parsers = {inicio: construir_parser(inicio)
+                    for inicio in ("definiciones", "bloque_simulacion")}
+        _lexer = construir_lexer()
+
+def analizar_bloque(tarea):
+    """
+    Analiza un fragmento. Tarea: (texto, línea inicial, columna inicial,
+    símbolo inicial); devuelve lo mismo que interprete.analizar_fragmento.
+    """
+    texto, linea, columna, inicio = tarea
+    _preparar()
+    texto = " " * (columna - 1) + texto
+    return analizar_fragmento(texto, _parsers[inicio], _lexer, linea)
+
+# --------------------------------------------------------------
+# ANÁLISIS EN PARALELO
+# --------------------------------------------------------------
+
+def _tareas(texto, fragmentos, inicios):
+    """Recorta cada fragmento junto con la línea y columna donde empieza."""
+    tareas = []
+    linea, anterior = 1, 0
+    for (desde, hasta), inicio in zip(fragmentos, inicios):
+        linea += texto.count("\n", anterior, desde)
+        anterior = desde
+        columna = desde - texto.rfind("\n", 0, desde)
+        tareas.append((texto[desde:hasta], linea, columna, inicio))
+    return tareas
+
+
+def _unir(partes):
+    """
+    Une los luchadores de cada fragmento en orden. Un nombre ya visto
+    en un fragmento anterior se informa en la nueva definición, que
+    reemplaza a la anterior conservando su lugar (como un dict).
+    """
+    luchadores, posiciones, diagnosticos = {}, {}, []
+    simulacion = None
+    for resultado, definidos, lugares, encontrados in partes:
+        diagnosticos.extend(encontrados)
+        for nombre, luchador in definidos.items():
+            linea, columna = lugares[nombre]
+            if nombre in posiciones:
+                diagnosticos.append(Diagnostico(
+                    'semantico', linea, columna,
+                    f"luchador '{nombre}' ya definido en la línea {posiciones[nombre][0]}"))
+            # Cada proceso internó sus propias copias; aquí se vuelven
+            # a compartir las definiciones idénticas.
+            for n, accion in luchador.acciones.items():
+                luchador.acciones[n] = internar(accion, acciones_internadas)
+            for n, combo in luchador.combos.items():
+                luchador.combos[n] = internar(combo, combos_internados)
+            luchadores[nombre] = luchador
+            posiciones[nombre] = (linea, columna)
+        if resultado is not None:
+            simulacion = resultado
+    return luchadores, simulacion, diagnosticos
+
+
+def analizar_paralelo(texto, procesos=None, tam_minimo=TAM_MINIMO):
+    """
+    Igual que interprete.analizar (devuelve (programa, diagnosticos)),
+    pero reparte los bloques de luchadores entre `procesos` procesos.
+    Con un solo proceso, textos pequeños o archivos que el pre-escaneo
+    no reconoce se analiza de forma secuencial.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    bloques = dividir_bloques(texto) if procesos > 1 else None
+    if not es_biblioteca(bloques):
+        return analizar(texto)
+
+    definiciones = bloques[:-1]
+    # Unos cuatro fragmentos por proceso para repartir bien la carga
+    tam_objetivo = max(tam_minimo, definiciones[-1][1] // (procesos * 4))
+    fragmentos = agrupar_fragmentos(definiciones, tam_objetivo)
+    if len(fragmentos) < 2:
+        return analizar(texto)
+    fragmentos.append((definiciones[-1][1], len(texto)))
+    inicios = ["definiciones"] * (len(fragmentos) - 1) + ["bloque_simulacion"]
+    tareas = _tareas(texto, fragmentos, inicios)
+
+    with ProcessPoolExecutor(max_workers=min(procesos, len(tareas)),
+                             initializer=_preparar) as pool:
+        partes = list(pool.map(analizar_bloque, tareas))
+
+    # Un fragmento intermedio que termina a mitad de una regla indica
+    # que una llave de más y otra de menos dentro de los bloques
+    # engañaron al pre-escaneo: el parser ve los bloques de otra forma
+    # y solo el análisis secuencial informa los mismos errores.
+    if any(d.mensaje == FIN_INESPERADO for *_, encontrados in partes[:-1] for d in encontrados):
+        return analizar(texto)
+
+    luchadores, simulacion, diagnosticos = _unir(partes)
+    if diagnosticos:
+        diagnosticos.sort(key=lambda d: (d.linea, d.columna))
+        return None, diagnosticos
+    return Programa(luchadores, simulacion), diagnosticos
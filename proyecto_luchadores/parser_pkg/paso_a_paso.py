@@ -0,0 +1,256 @@
+# ==============================================================
+#  parser_pkg/paso_a_paso.py
+# ==============================================================
+#  COMBATE EJECUTABLE PASO A PASO
+# --------------------------------------------------------------
+#  motor_combate.pelear simula un combate de principio a fin.
+#  PeleaPasoAPaso hace la misma simulación pero avanzando una
+#  instrucción `usa` (paso), un turno o hasta el final, y permite
+#  guardar y recuperar el estado en cualquier momento.
+#   - Los guiones se compilan una vez a una lista plana de
+#     operaciones (usa / si / salta), así que la posición dentro
+#     del turno es un simple contador de programa.
+#   - Todo el estado mutable cabe en una tupla de 8 enteros
+#     (hp1, st1, hp2, st2, ronda, lado, pc, jugados): snapshot()
+#     y restore() no copian luchadores ni definiciones, de modo
+#     que ramificar un combate millones de veces es barato.
+#  Los resultados son idénticos a los de motor_combate.pelear.
+# ==============================================================
+
+import operator
+
+from parser_pkg.gramatica import Usar, SiSino
+from parser_pkg.motor_combate import Resultado, guion_de
+
+OP_USA, OP_SI, OP_SALTA = 0, 1, 2
+
+COMPARADORES = {'<': operator.lt, '<=': operator.le, '>': operator.gt,
+                '>=': operator.ge, '==': operator.eq, '!=': operator.ne}
+
+# --------------------------------------------------------------
+# COMPILACIÓN DE GUIONES
+# --------------------------------------------------------------
+
+def compilar(instrucciones, codigo=None):
+    """
+    Convierte una lista de instrucciones en operaciones planas:
+      (OP_USA, nombre)
+      (OP_SI, sujeto, atributo, comparador, valor, destino_si_falsa)
+      (OP_SALTA, destino)
+    donde sujeto es 0 (self) o 2 (oponente), relativo a quien actúa,
+    y atributo 0 (hp) o 1 (st).
+    """
+    if codigo is None:
+        codigo = []
+    for instr in instrucciones:
+        if isinstance(instr, Usar):
+            codigo.append((OP_USA, instr.nombre))
+        elif isinstance(instr, SiSino):
+            cond = instr.condicion
+            pos_si = len(codigo)
+            codigo.append(None)
+            compilar(instr.bloque_si, codigo)
+            pos_salta = len(codigo)
+            codigo.append(None)
+            codigo[pos_si] = (OP_SI, 0 if cond.quien == 'self' else 2,
+                              0 if cond.atributo == 'hp' else 1,
+                              COMPARADORES.get(cond.operador, lambda a, b: False),
+                              cond.valor, len(codigo))
+            compilar(instr.bloque_sino, codigo)
+            codigo[pos_salta] = (OP_SALTA, len(codigo))
+    return codigo
+
+
+def aplicar(nombre, luchador, estado, yo, rival, usados=None):
+    """
+    Igual que motor_combate.aplicar_accion, pero sobre `estado` =
+    [hp1, st1, hp2, st2]; `yo` y `rival` son 0 o 2 (posición del HP).
+    Si se pasa el conjunto `usados`, se le agrega (yo, clase, nombre,
+    campo) por cada campo numérico consultado.
+    """
+    if nombre in luchador.combos:
+        combo = luchador.combos[nombre]
+        if usados is not None:
+            usados.add((yo, "combo", combo.nombre, "st_req"))
+        if estado[yo + 1] >= combo.st_req:
+            estado[yo + 1] -= combo.st_req
+            for act in combo.acciones:
+                aplicar(act, luchador, estado, yo, rival, usados)
+        else:
+            aplicar(combo.acciones[0], luchador, estado, yo, rival, usados)
+    elif nombre in luchador.acciones:
+        accion = luchador.acciones[nombre]
+        if accion.tipo == "bloqueo":
+            return
+        if usados is not None:
+            usados.add((yo, "accion", accion.nombre, "costo"))
+        if estado[yo + 1] < accion.costo:
+            return
+        if usados is not None:
+            usados.add((yo, "accion", accion.nombre, "daño"))
+        estado[yo + 1] -= accion.costo
+        estado[rival] = max(0, estado[rival] - accion.daño)
+
+# --------------------------------------------------------------
+# COMBATE PASO A PASO
+# --------------------------------------------------------------
+
+class PeleaPasoAPaso:
+    """
+    Combate entre dos luchadores que se ejecuta a demanda. Recibe los
+    mismos argumentos que motor_combate.pelear; los luchadores solo se
+    leen (su HP/ST actual es el estado inicial) y nunca se modifican.
+    Entre llamadas el combate queda detenido justo antes de una
+    instrucción `usa` o terminado. Si `usados` es un conjunto, cada paso
+    registra en él los campos numéricos que consulta (ver aplicar).
+    """
+    def __init__(self, l1, l2, turnos, inicia, turnos_max):
+        self.luchadores = (l1, l2)
+        self.turnos_max = turnos_max
+        segundo = l1.nombre if inicia != l1.nombre else l2.nombre
+        lados = []
+        for quien in (inicia, segundo):
+            # Misma resolución de nombres que motor_combate.pelear
+            yo = 0 if quien == l1.nombre else 2
+            guion = turnos.get(quien)
+            lados.append((yo, 2 - yo, None if guion is None else compilar(guion)))
+        self._lados = tuple(lados)
+
+        self.estado = [l1.hp, l1.st, l2.hp, l2.st]
+        self.ronda = 0
+        self.lado = 0
+        self.pc = 0
+        self.jugados = None
+        self.usados = None
+        if turnos_max <= 0:
+            self.jugados = turnos_max
+        self._posicionar()
+
+    @classmethod
+    def desde_programa(cls, programa, nombre1, nombre2, inicia=None, turnos_max=None):
+        """Como motor_combate.enfrentar: guion de cada luchador de la biblioteca."""
+        turnos = {nombre1: guion_de(programa, nombre1),
+                  nombre2: guion_de(programa, nombre2)}
+        if turnos_max is None:
+            turnos_max = programa.simulacion.config.turnos
+        return cls(programa.luchadores[nombre1], programa.luchadores[nombre2],
+                   turnos, inicia or nombre1, turnos_max)
+
+    @classmethod
+    def desde_simulacion(cls, programa):
+        """
+        El combate descrito en el bloque `simulacion` (como motor_combate.ejecutar).
+        Las batallas campales (más de dos luchadores) no se admiten.
+        """
+        config = programa.simulacion.config
+        if len(config.luchadores) > 2:
+            raise ValueError(f"la simulación es una batalla campal de {len(config.luchadores)} "
+                             "luchadores; el combate paso a paso solo admite dos")
+        turnos = {t.luchador: t.acciones for t in programa.simulacion.turnos}
+        return cls(programa.luchadores[config.luch1], programa.luchadores[config.luch2],
+                   turnos, config.inicia, config.turnos)
+
+    # ----------------------------------------------------------
+    # ESTADO
+    # ----------------------------------------------------------
+
+    @property
+    def terminado(self):
+        return self.jugados is not None
+
+    @property
+    def quien(self):
+        """Nombre del luchador al que le toca actuar (None si terminó)."""
+        if self.terminado:
+            return None
+        return self.luchadores[self._lados[self.lado][0] // 2].nombre
+
+    @property
+    def siguiente(self):
+        """Nombre de la acción o combo que se usará en el próximo paso."""
+        if self.terminado:
+            return None
+        return self._lados[self.lado][2][self.pc][1]
+
+    def snapshot(self):
+        """Tupla inmutable con todo el estado mutable del combate."""
+        return (*self.estado, self.ronda, self.lado, self.pc, self.jugados)
+
+    def restore(self, foto):
+        """Vuelve al estado guardado con snapshot()."""
+        hp1, st1, hp2, st2, self.ronda, self.lado, self.pc, self.jugados = foto
+        self.estado = [hp1, st1, hp2, st2]
+
+    def resultado(self):
+        """Resultado con el estado actual (turnos jugados hasta ahora si no terminó)."""
+        l1, l2 = self.luchadores
+        turnos = self.jugados if self.terminado else self.ronda
+        return Resultado(l1.nombre, l2.nombre, *self.estado, turnos)
+
+    # ----------------------------------------------------------
+    # AVANCE
+    # ----------------------------------------------------------
+
+    def _posicionar(self):
+        """
+        Evalúa condiciones y saltos hasta quedar ante un `usa`; cierra
+        los turnos que se acaban y salta a quienes no tienen guion.
+        """
+        estado = self.estado
+        while self.jugados is None:
+            yo, rival, codigo = self._lados[self.lado]
+            if codigo is not None:
+                pc = self.pc
+                while pc < len(codigo):
+                    op = codigo[pc]
+                    if op[0] == OP_USA:
+                        self.pc = pc
+                        return
+                    if op[0] == OP_SI:
+                        sujeto = yo if op[1] == 0 else rival
+                        pc = pc + 1 if op[3](estado[sujeto + op[2]], op[4]) else op[5]
+                    else:
+                        pc = op[1]
+                # Fin del turno: se comprueba si alguien cayó
+                if estado[0] <= 0 or estado[2] <= 0:
+                    self.jugados = self.ronda + 1
+                    return
+            self.pc = 0
+            self.lado += 1
+            if self.lado == len(self._lados):
+                self.lado = 0
+                if estado[0] <= 0 or estado[2] <= 0:
+                    self.jugados = self.ronda + 1
+                    return
+                self.ronda += 1
+                if self.ronda >= self.turnos_max:
+                    self.jugados = self.turnos_max
+
+    def paso(self):
+        """
+        Ejecuta la siguiente instrucción `usa`. Devuelve False si el
+        combate ya había terminado.
+        """
+        if self.jugados is not None:
+            return False
+        yo, rival, codigo = self._lados[self.lado]
+        aplicar(codigo[self.pc][1], self.luchadores[yo // 2], self.estado, yo, rival,
+                self.usados)
+        self.pc += 1
+        self._posicionar()
+        return True
+
+    def turno(self):
+        """Termina el turno en curso. Devuelve False si el combate ya había terminado."""
+        if self.jugados is not None:
+            return False
+        actual = (self.ronda, self.lado)
+        while self.jugados is None and (self.ronda, self.lado) == actual:
+            self.paso()
+        return True
+
+    def terminar(self):
+        """Ejecuta el resto del combate y devuelve el Resultado."""
+        while self.jugados is None:
+            self.paso()
+        return self.resultado()
@@ -0,0 +1,218 @@
+# ==============================================================
+#  parser_pkg/ranking.py
+# ==============================================================
+#  CLASIFICACIÓN ADAPTATIVA (SISTEMA SUIZO + GLICKO)
+# --------------------------------------------------------------
+#  El torneo todos contra todos necesita N·(N-1) combates. Aquí
+#  cada ronda empareja a los luchadores de rating parecido
+#  (sistema suizo, sin repetir rivales), simula en paralelo los
+#  dos combates de cada pareja (uno iniciando cada luchador) sobre
+#  la biblioteca en memoria compartida y actualiza un rating
+#  Glicko (valor + desviación) de cada uno. Se detiene cuando la
+#  clasificación deja de moverse: la correlación de Spearman con
+#  la ronda anterior supera `confianza` durante `paciencia`
+#  rondas seguidas. Cada ronda cuesta unos N combates y hacen
+#  falta del orden de log N rondas.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m parser_pkg.ranking biblioteca.txt -j 4 --top 20
+# ==============================================================
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+from parser_pkg.parseo_paralelo import analizar_paralelo
+from parser_pkg.roster_compartido import RosterCompartido, crear_pool, simular_pares
+
+RATING_INICIAL = 1500.0
+DESVIACION_INICIAL = 350.0
+_Q = math.log(10) / 400
+
+
+def _silencio(*args, **kwargs):
+    """Registro vacío: descarta los mensajes de progreso."""
+
+# --------------------------------------------------------------
+# GLICKO
+# --------------------------------------------------------------
+
+def _g(desviacion):
+    return 1 / math.sqrt(1 + 3 * _Q * _Q * desviacion * desviacion / (math.pi * math.pi))
+
+
+def esperado(r, r_rival, rd_rival):
+    """Puntuación esperada contra un rival según el modelo de Glicko."""
+    return 1 / (1 + 10 ** (-_g(rd_rival) * (r - r_rival) / 400))
+
+
+def actualizar_glicko(ratings, desviaciones, partidas):
+    """
+    Actualiza (en el sitio) los ratings tras un período de partidas.
+    `partidas` es una lista de (i, j, puntuacion_i) con puntuación 1
+    (gana i), 0.5 (empate) o 0 (gana j); cada partida cuenta para los
+    dos luchadores. Todos los resultados del período se evalúan con
+    los ratings previos al período.
+    """
+    acumulado = {}
+    for i, j, s in partidas:
+        for yo, rival, puntos in ((i, j, s), (j, i, 1 - s)):
+            g = _g(desviaciones[rival])
+            e = esperado(ratings[yo], ratings[rival], desviaciones[rival])
+            suma = acumulado.setdefault(yo, [0.0, 0.0])
+            suma[0] += g * g * e * (1 - e)
+            suma[1] += g * (puntos - e)
+    for yo, (varianza_inv, mejora) in acumulado.items():
+        d2_inv = _Q * _Q * varianza_inv
+        precision = 1 / desviaciones[yo] ** 2 + d2_inv
+        ratings[yo] += _Q / precision * mejora
+        desviaciones[yo] = math.sqrt(1 / precision)
+
+# --------------------------------------------------------------
+# EMPAREJAMIENTO SUIZO
+# --------------------------------------------------------------
+
+def emparejar(orden, jugados):
+    """
+    Empareja los luchadores de `orden` (del mejor al peor) con el
+    siguiente libre contra el que todavía no hayan peleado. Quien no
+    encuentra rival nuevo descansa esta ronda.
+    """
+    ocupados = set()
+    pares = []
+    for a, i in enumerate(orden):
+        if i in ocupados:
+            continue
+        for b in range(a + 1, len(orden)):
+            j = orden[b]
+            if j not in ocupados and (min(i, j), max(i, j)) not in jugados:
+                pares.append((i, j))
+                ocupados.update((i, j))
+                break
+    return pares
+
+
+def spearman(anterior, actual):
+    """Correlación de Spearman entre dos órdenes de los mismos índices."""
+    n = len(actual)
+    if n < 2:
+        return 1.0
+    puesto = {x: k for k, x in enumerate(anterior)}
+    suma = sum((puesto[x] - k) ** 2 for k, x in enumerate(actual))
+    return 1 - 6 * suma / (n * (n * n - 1))
+
+# --------------------------------------------------------------
+# CLASIFICACIÓN
+# --------------------------------------------------------------
+
+def puntuacion(hp_yo, hp_rival):
+    if hp_yo > hp_rival:
+        return 1.0
+    if hp_yo < hp_rival:
+        return 0.0
+    return 0.5
+
+
+def clasificar(programa, procesos=1, confianza=0.995, paciencia=2, rondas_max=None,
+               semilla=0, roster=None, log=_silencio):
+    """
+    Clasifica la biblioteca del programa por rondas suizas.
+    Devuelve (clasificacion, combates) donde clasificacion es una lista
+    [(nombre, rating, desviacion)] del mejor al peor y combates es la
+    cantidad de combates simulados. Se puede pasar un RosterCompartido
+    ya creado para reutilizarlo. Con procesos > 1 el pool de
+    trabajadores se crea una sola vez y cada ronda se reparte en un
+    lote por proceso.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    propio = roster is None
+    if propio:
+        roster = RosterCompartido.crear(programa)
+    nombres = list(programa.luchadores)
+    n = len(nombres)
+    turnos_max = programa.simulacion.config.turnos
+    if rondas_max is None:
+        rondas_max = 4 * max(1, math.ceil(math.log2(max(n, 2))))
+
+    ratings = [RATING_INICIAL] * n
+    desviaciones = [DESVIACION_INICIAL] * n
+    jugados = set()
+    azar = random.Random(semilla)
+    orden = list(range(n))
+    azar.shuffle(orden)        # primera ronda: emparejamiento al azar
+    combates, estables = 0, 0
+
+    pool = crear_pool(roster, procesos) if procesos > 1 else None
+    try:
+        for ronda in range(1, rondas_max + 1):
+            pares = emparejar(orden, jugados)
+            if not pares:
+                break
+            combates_ronda = [c for i, j in pares for c in ((i, j), (j, i))]
+            tam_lote = math.ceil(len(combates_ronda) / procesos)
+            resultados = simular_pares(roster, combates_ronda, turnos_max, procesos,
+                                       tam_lote, executor=pool)
+            combates += len(combates_ronda)
+
+            partidas = []
+            for (i, j), (hp_i, _, hp_j, _, _) in zip(combates_ronda, resultados):
+                partidas.append((i, j, puntuacion(hp_i, hp_j)))
+            for i, j in pares:
+                jugados.add((min(i, j), max(i, j)))
+            actualizar_glicko(ratings, desviaciones, partidas)
+
+            anterior = orden
+            orden = sorted(range(n), key=lambda k: (-ratings[k], k))
+            rho = spearman(anterior, orden) if ronda > 1 else 0.0
+            estables = estables + 1 if rho >= confianza else 0
+            log(f"  ronda {ronda:>3}: {combates} combates, spearman={rho:.4f}")
+            if estables >= paciencia:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if propio:
+            roster.liberar()
+
+    clasificacion = [(nombres[k], ratings[k], desviaciones[k]) for k in orden]
+    return clasificacion, combates
+
+# --------------------------------------------------------------
+# LÍNEA DE COMANDOS
+# --------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Clasificación adaptativa (suizo + Glicko) sin torneo completo.")
+    parser.add_argument("archivo", help="archivo fuente con la biblioteca de luchadores")
+    parser.add_argument("-j", "--procesos", type=int, default=1)
+    parser.add_argument("--confianza", type=float, default=0.995,
+                        help="correlación de Spearman entre rondas para detenerse")
+    parser.add_argument("--paciencia", type=int, default=2,
+                        help="rondas seguidas que la clasificación debe ser estable")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--top", type=int, default=10, help="posiciones a mostrar")
+    args = parser.parse_args(argv)
+
+    with open(args.archivo, "r", encoding="utf-8") as f:
+        programa, diagnosticos = analizar_paralelo(f.read(), args.procesos)
+    if diagnosticos:
+        for d in diagnosticos:
+            print(f"{args.archivo}:{d}")
+        return 1
+
+    inicio = time.perf_counter()
+    clasificacion, combates = clasificar(programa, args.procesos, args.confianza,
+                                         args.paciencia, semilla=args.semilla, log=print)
+    duracion = time.perf_counter() - inicio
+    n = len(clasificacion)
+    print(f"\n{combates} combates ({n * (n - 1)} en todos contra todos), {duracion:.2f} s\n")
+    for pos, (nombre, rating, desviacion) in enumerate(clasificacion[:args.top], 1):
+        print(f"{pos:>4}. {nombre:<20} {rating:7.1f} ± {2 * desviacion:5.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+# ==============================================================
+#  parser_pkg/roster_compartido.py
+# ==============================================================
+#  BIBLIOTECA CODIFICADA EN MEMORIA COMPARTIDA
+# --------------------------------------------------------------
+#  Codifica una vez toda la biblioteca de luchadores en arreglos
+#  planos de enteros (int32), con identificadores numéricos en
+#  lugar de nombres:
+#    luchadores  hp, st y rango de su guion compilado
+#    acciones    daño, costo y si es bloqueo
+#    combos      st_req y rango de sus miembros
+#    miembros    referencias a acciones/combos de cada combo
+#    codigo      guiones compilados, 5 enteros por instrucción
+#  Todo vive en un único bloque de multiprocessing.shared_memory:
+#  los procesos trabajadores se adjuntan sin copiar nada y
+#  simulan los combates directamente sobre los arreglos, de modo
+#  que ni el arranque ni cada tarea tienen que serializar objetos
+#  Luchador.
+# ==============================================================
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from parser_pkg.gramatica import Usar, SiSino
+from parser_pkg.motor_combate import guion_de
+
+# Referencias a acciones o combos:
+#   r >= 0  -> acción r
+#   r == -1 -> nombre inexistente
+#   r <= -2 -> combo (-r - 2)
+INEXISTENTE = -1
+
+# Instrucciones compiladas: (op, a, b, c, d)
+OP_USA, OP_SI, OP_SALTA = 0, 1, 2
+#   USA    a = referencia
+#   SI     a = sujeto*2 + atributo (sujeto 0 self / 1 oponente,
+#          atributo 0 hp / 1 st), b = operador, c = valor,
+#          d = instrucción a la que saltar si es falsa
+#   SALTA  d = instrucción destino
+OPERADORES = {'<': 0, '<=': 1, '>': 2, '>=': 3, '==': 4, '!=': 5}
+
+CAMPOS = ("hp", "st", "guion", "danio", "costo", "bloqueo",
+          "st_req", "combo_miembros", "miembros", "codigo")
+
+# --------------------------------------------------------------
+# CODIFICACIÓN
+# --------------------------------------------------------------
+
+def _referencia(luchador, nombre, ids_acciones, ids_combos):
+    if nombre in luchador.combos:
+        return -2 - ids_combos[_clave_combo(luchador, nombre, ids_acciones)]
+    if nombre in luchador.acciones:
+        return ids_acciones[id(luchador.acciones[nombre])]
+    return INEXISTENTE
+
+
+def _clave_combo(luchador, nombre, ids_acciones):
+    """
+    Identifica un combo ya resuelto para `luchador`. El mismo objeto
+    Combo (internado) puede estar en varios luchadores, pero sus
+    miembros se buscan por nombre en cada uno: solo se comparte la
+    codificación si todos apuntan a las mismas acciones. Si algún
+    miembro es a su vez un combo, la codificación es propia del luchador.
+    """
+    combo = luchador.combos[nombre]
+    miembros = []
+    for n in combo.acciones:
+        if n in luchador.combos:
+            return id(combo), id(luchador)
+        accion = luchador.acciones.get(n)
+        miembros.append(INEXISTENTE if accion is None else ids_acciones[id(accion)])
+    return id(combo), tuple(miembros)
+
+
+def _compilar(instrucciones, luchador, ids_acciones, ids_combos, codigo, inicio):
+    """Agrega al arreglo `codigo` las instrucciones (saltos relativos a `inicio`)."""
+    for instr in instrucciones:
+        if isinstance(instr, Usar):
+            codigo.extend((OP_USA, _referencia(luchador, instr.nombre, ids_acciones, ids_combos),
+                           0, 0, 0))
+        elif isinstance(instr, SiSino):
+            cond = instr.condicion
+            pos_si = len(codigo)
+            codigo.extend((OP_SI,
+                           (cond.quien != 'self') * 2 + (cond.atributo != 'hp'),
+                           OPERADORES[cond.operador], cond.valor, 0))
+            _compilar(instr.bloque_si, luchador, ids_acciones, ids_combos, codigo, inicio)
+            pos_salta = len(codigo)
+            codigo.extend((OP_SALTA, 0, 0, 0, 0))
+            codigo[pos_si + 4] = (len(codigo) - inicio) // 5
+            _compilar(instr.bloque_sino, luchador, ids_acciones, ids_combos, codigo, inicio)
+            codigo[pos_salta + 4] = (len(codigo) - inicio) // 5
+
+
+def codificar(programa):
+    """
+    Convierte la biblioteca del programa en un diccionario
+    campo -> array('i') y devuelve (arreglos, nombres).
+    Cada acción se codifica una sola vez aunque varios luchadores
+    compartan el mismo objeto; los combos compartidos también, siempre
+    que sus miembros se resuelvan a las mismas acciones.
+    """
+    a = {campo: array('i') for campo in CAMPOS}
+    ids_acciones, ids_combos = {}, {}
+    nombres = list(programa.luchadores)
+
+    for l in programa.luchadores.values():
+        for accion in l.acciones.values():
+            if id(accion) not in ids_acciones:
+                ids_acciones[id(accion)] = len(a["danio"])
+                a["danio"].append(accion.daño)
+                a["costo"].append(accion.costo)
+                a["bloqueo"].append(accion.tipo == "bloqueo")
+
+    pendientes = []
+    for l in programa.luchadores.values():
+        for nombre, combo in l.combos.items():
+            clave = _clave_combo(l, nombre, ids_acciones)
+            if clave not in ids_combos:
+                ids_combos[clave] = len(a["st_req"])
+                a["st_req"].append(combo.st_req)
+                pendientes.append((l, combo))
+
+    a["combo_miembros"].append(0)
+    for l, combo in pendientes:
+        a["miembros"].extend(_referencia(l, n, ids_acciones, ids_combos)
+                             for n in combo.acciones)
+        a["combo_miembros"].append(len(a["miembros"]))
+
+    a["guion"].append(0)
+    for nombre, l in programa.luchadores.items():
+        a["hp"].append(l.hp_max)
+        a["st"].append(l.st_max)
+        inicio = len(a["codigo"])
+        _compilar(guion_de(programa, nombre), l, ids_acciones, ids_combos, a["codigo"], inicio)
+        a["guion"].append(len(a["codigo"]) // 5)
+    return a, nombres
+
+# --------------------------------------------------------------
+# BLOQUE DE MEMORIA COMPARTIDA
+# --------------------------------------------------------------
+
+class RosterCompartido:
+    """
+    Biblioteca codificada en un bloque de memoria compartida.
+    El proceso que la crea con RosterCompartido.crear(...) es el dueño y
+    debe llamar a liberar(); los trabajadores usan adjuntar(descriptor).
+    """
+    def __init__(self, memoria, disposicion, nombres=None):
+        self.memoria = memoria
+        self.disposicion = disposicion
+        self.nombres = nombres
+        vista = memoryview(memoria.buf).cast('i')
+        self._vista = vista
+        for campo, (inicio, largo) in disposicion.items():
+            setattr(self, campo, vista[inicio:inicio + largo])
+        self.n = len(self.hp)
+
+    @classmethod
+    def crear(cls, programa):
+        arreglos, nombres = codificar(programa)
+        disposicion, desplazamiento = {}, 0
+        for campo in CAMPOS:
+            disposicion[campo] = (desplazamiento, len(arreglos[campo]))
+            desplazamiento += len(arreglos[campo])
+        memoria = SharedMemory(create=True, size=max(4, desplazamiento * 4))
+        vista = memoryview(memoria.buf).cast('i')
+        for campo in CAMPOS:
+            inicio, largo = disposicion[campo]
+            vista[inicio:inicio + largo] = arreglos[campo]
+        vista.release()
+        return cls(memoria, disposicion, nombres)
+
+    def descriptor(self):
+        """Datos mínimos (y serializables) para adjuntarse desde otro proceso."""
+        return self.memoria.name, self.disposicion
+
+    @classmethod
+    def adjuntar(cls, descriptor):
+        nombre, disposicion = descriptor
+        return cls(SharedMemory(name=nombre), disposicion)
+
+    def cerrar(self):
+        for campo in CAMPOS:
+            getattr(self, campo).release()
+        self._vista.release()
+        self.memoria.close()
+
+    def liberar(self):
+        self.cerrar()
+        self.memoria.unlink()
+
+    # ----------------------------------------------------------
+    # SIMULACIÓN SOBRE LOS ARREGLOS
+    # ----------------------------------------------------------
+
+    def _aplicar(self, ref, st, hp_rival):
+        """Equivalente a motor_combate.aplicar_accion; devuelve (st, hp_rival)."""
+        if ref <= -2:
+            c = -2 - ref
+            requerido = self.st_req[c]
+            inicio, fin = self.combo_miembros[c], self.combo_miembros[c + 1]
+            if st >= requerido:
+                st -= requerido
+                for k in range(inicio, fin):
+                    st, hp_rival = self._aplicar(self.miembros[k], st, hp_rival)
+            else:
+                st, hp_rival = self._aplicar(self.miembros[inicio], st, hp_rival)
+        elif ref >= 0:
+            if self.bloqueo[ref] or st < self.costo[ref]:
+                return st, hp_rival
+            st -= self.costo[ref]
+            hp_rival = max(0, hp_rival - self.danio[ref])
+        return st, hp_rival
+
+    def _turno(self, luchador, estado, yo, rival):
+        """Ejecuta el guion de `luchador`; estado = [hp, st] de cada lado."""
+        codigo = self.codigo
+        base = self.guion[luchador]
+        total = self.guion[luchador + 1] - base
+        pc = 0
+        while pc < total:
+            k = (base + pc) * 5
+            op = codigo[k]
+            if op == OP_USA:
+                estado[yo + 1], estado[rival] = self._aplicar(codigo[k + 1], estado[yo + 1], estado[rival])
+                pc += 1
+            elif op == OP_SI:
+                sujeto = rival if codigo[k + 1] >= 2 else yo
+                actual = estado[sujeto + (codigo[k + 1] & 1)]
+                op_cmp, valor = codigo[k + 2], codigo[k + 3]
+                if op_cmp == 0:
+                    cumple = actual < valor
+                elif op_cmp == 1:
+                    cumple = actual <= valor
+                elif op_cmp == 2:
+                    cumple = actual > valor
+                elif op_cmp == 3:
+                    cumple = actual >= valor
+                elif op_cmp == 4:
+                    cumple = actual == valor
+                else:
+                    cumple = actual != valor
+                pc = pc + 1 if cumple else codigo[k + 4]
+            else:
+                pc = codigo[k + 4]
+
+    def pelear(self, i, j, turnos_max):
+        """
+        Combate en que el luchador i inicia contra j (i != j), con los
+        mismos resultados que motor_combate.enfrentar.
+        Devuelve (hp_i, st_i, hp_j, st_j, turnos_jugados).
+        """
+        estado = [self.hp[i], self.st[i], self.hp[j], self.st[j]]
+        for t in range(turnos_max):
+            self._turno(i, estado, 0, 2)
+            if estado[0] <= 0 or estado[2] <= 0:
+                return (*estado, t + 1)
+            self._turno(j, estado, 2, 0)
+            if estado[0] <= 0 or estado[2] <= 0:
+                return (*estado, t + 1)
+        return (*estado, turnos_max)
+
+# --------------------------------------------------------------
+# POOL DE TRABAJADORES
+# --------------------------------------------------------------
+
+_roster = None
+
+def _adjuntar(descriptor):
+    global _roster
+    _roster = RosterCompartido.adjuntar(descriptor)
+
+def _simular(pares, turnos_max):
+    """Tarea: pares = array('i') plano (i0, j0, i1, j1, ...)."""
+    pares = array('i', pares)
+    salida = array('i')
+    for k in range(0, len(pares), 2):
+        salida.extend(_roster.pelear(pares[k], pares[k + 1], turnos_max))
+    return salida.tobytes()
+
+
+def crear_pool(roster, procesos, mp_context=None):
+    """
+    Pool de `procesos` trabajadores adjuntos al bloque compartido del
+    roster, para reutilizarlo en varias llamadas a simular_pares.
+    Debe cerrarse (shutdown) antes de liberar el roster.
+    """
+    return ProcessPoolExecutor(max_workers=procesos, mp_context=mp_context,
+                               initializer=_adjuntar, initargs=(roster.descriptor(),))
+
+
+def simular_pares(roster, pares, turnos_max, procesos=None, tam_lote=4096, mp_context=None,
+                  executor=None):
+    """
+    Simula los combates (i, j) de `pares` repartidos en un pool cuyos
+    procesos se adjuntan al bloque compartido. Cada tarea viaja como
+    bytes de enteros. `mp_context` elige el método de arranque de los
+    procesos. Con `executor` (ver crear_pool) se usa ese pool en lugar
+    de crear uno nuevo. Devuelve una lista de tuplas (hp_i, st_i, hp_j,
+    st_j, turnos).
+    """
+    global _roster
+    plano = array('i')
+    for i, j in pares:
+        plano.extend((i, j))
+    procesos = procesos or os.cpu_count() or 1
+
+    lotes = [plano[k:k + 2 * tam_lote].tobytes() for k in range(0, len(plano), 2 * tam_lote)]
+    if executor is not None:
+        partes = list(executor.map(_simular, lotes, [turnos_max] * len(lotes)))
+    elif procesos == 1 or len(lotes) <= 1:
+        _roster = roster
+        partes = [_simular(lote, turnos_max) for lote in lotes]
+    else:
+        with crear_pool(roster, procesos, mp_context) as pool:
+            partes = list(pool.map(_simular, lotes, [turnos_max] * len(lotes)))
+
+    salida = array('i')
+    for parte in partes:
+        salida.frombytes(parte)
+    return [tuple(salida[k:k + 5]) for k in range(0, len(salida), 5)]
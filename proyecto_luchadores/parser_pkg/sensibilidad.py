@@ -0,0 +1,190 @@
+# ==============================================================
+#  parser_pkg/sensibilidad.py
+# ==============================================================
+#  ANÁLISIS DE SENSIBILIDAD DEL COMBATE
+# --------------------------------------------------------------
+#  Responde preguntas como "¿y si puño_de_fuego hiciera 13 de
+#  daño en lugar de 12?" para cada daño, costo y st_req de las
+#  acciones y combos de los dos luchadores de la simulación.
+#  En lugar de repetir el combate completo por cada variante:
+#   - el combate base se ejecuta una vez con PeleaPasoAPaso,
+#     guardando una foto antes de cada paso y anotando en qué
+#     paso se consulta por primera vez cada campo;
+#   - hasta ese paso la variante es idéntica al combate base, así
+#     que arranca desde esa foto (un campo que nunca se consulta
+#     no cambia nada y ni siquiera se simula);
+#   - las variantes se reparten entre un pool de procesos.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m parser_pkg.sensibilidad ejemplos/programa.txt --deltas -1 1
+# ==============================================================
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from parser_pkg.balanceador import aplicar_parametros, extraer_parametros
+from parser_pkg.interprete import analizar
+from parser_pkg.motor_combate import Resultado
+from parser_pkg.paso_a_paso import PeleaPasoAPaso
+
+# --------------------------------------------------------------
+# COMBATE BASE
+# --------------------------------------------------------------
+
+def perfil_base(programa):
+    """
+    Ejecuta el combate de la simulación paso a paso. Devuelve
+    (resultado, fotos, primer_uso) donde fotos[k] es el estado antes
+    del paso k y primer_uso asocia (luchador, clase, nombre, campo) con
+    el primer paso que consulta ese campo.
+    """
+    pelea = PeleaPasoAPaso.desde_simulacion(programa)
+    config = programa.simulacion.config
+    nombres = {0: config.luch1, 2: config.luch2}
+    fotos, primer_uso = [], {}
+    pelea.usados = set()
+    while not pelea.terminado:
+        fotos.append(pelea.snapshot())
+        pelea.paso()
+        for yo, clase, nombre, campo in pelea.usados:
+            primer_uso.setdefault((nombres[yo], clase, nombre, campo), len(fotos) - 1)
+        pelea.usados.clear()
+    fotos.append(pelea.snapshot())
+    return pelea.resultado(), fotos, primer_uso
+
+# --------------------------------------------------------------
+# VARIANTES
+# --------------------------------------------------------------
+
+_programa = None
+
+def _preparar(programa):
+    global _programa
+    _programa = programa
+
+def _simular_variante(tarea):
+    """Tarea: (parametro, valor, foto). Devuelve (tupla del resultado, pasos)."""
+    parametro, valor, foto = tarea
+    variante = aplicar_parametros(_programa, [parametro], [valor])
+    pelea = PeleaPasoAPaso.desde_simulacion(variante)
+    pelea.restore(foto)
+    pasos = 0
+    while pelea.paso():
+        pasos += 1
+    return pelea.resultado().como_tupla(), pasos
+
+
+class Variante:
+    """Resultado del combate con un campo cambiado de `original` a `valor`."""
+    def __init__(self, parametro, original, valor, resultado, usado):
+        self.parametro = parametro
+        self.original = original
+        self.valor = valor
+        self.resultado = resultado
+        self.usado = usado        # False si el campo nunca se consulta
+
+    def __repr__(self):
+        p = self.parametro
+        return (f"<Variante {p.luchador}.{p.nombre}.{p.campo} "
+                f"{self.original}->{self.valor} {self.resultado!r}>")
+
+
+def sensibilidad(programa, deltas=(-1, 1), procesos=1):
+    """
+    Prueba cada daño, costo y st_req de los dos luchadores de la
+    simulación sumándole cada valor de `deltas` (se omiten los valores
+    negativos). Devuelve (base, variantes, pasos_simulados, pasos_completos):
+    los pasos que se simularon y los que habrían hecho falta repitiendo
+    cada combate desde el principio. Solo admite simulaciones de dos
+    luchadores (ValueError con una batalla campal).
+    """
+    config = programa.simulacion.config
+    if len(config.luchadores) > 2:
+        raise ValueError(f"la simulación es una batalla campal de {len(config.luchadores)} "
+                         "luchadores; el análisis de sensibilidad solo admite dos")
+    base, fotos, primer_uso = perfil_base(programa)
+    total = len(fotos) - 1
+    parametros, vector = extraer_parametros(programa, {config.luch1, config.luch2})
+
+    variantes, tareas = [], []
+    for parametro, original in zip(parametros, vector):
+        if parametro.clase == "stats":
+            continue
+        clave = (parametro.luchador, parametro.clase, parametro.nombre, parametro.campo)
+        for delta in deltas:
+            valor = original + delta
+            if delta == 0 or valor < parametro.minimo:
+                continue
+            primero = primer_uso.get(clave)
+            variante = Variante(parametro, original, valor, base, primero is not None)
+            variantes.append(variante)
+            if primero is not None:
+                tareas.append((variante, (parametro, valor, fotos[primero]), primero))
+
+    lista = [tarea for _, tarea, _ in tareas]
+    if procesos > 1 and len(lista) > 1:
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_preparar,
+                                 initargs=(programa,)) as pool:
+            salidas = list(pool.map(_simular_variante, lista,
+                                    chunksize=max(1, len(lista) // (4 * procesos))))
+    else:
+        _preparar(programa)
+        salidas = [_simular_variante(tarea) for tarea in lista]
+
+    simulados, completos = 0, total * (len(variantes) - len(tareas))
+    for (variante, _, primero), (tupla, pasos) in zip(tareas, salidas):
+        variante.resultado = Resultado(config.luch1, config.luch2, *tupla)
+        simulados += pasos
+        completos += primero + pasos
+    return base, variantes, simulados, completos
+
+# --------------------------------------------------------------
+# LÍNEA DE COMANDOS
+# --------------------------------------------------------------
+
+def _describir(r):
+    ganador = f"gana {r.ganador}" if r.ganador else "empate"
+    return f"{ganador:<16} HP {r.hp1:>4} / {r.hp2:<4} {r.turnos:>3} turnos"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Cómo cambia el combate al variar daño, costo y st_req.")
+    parser.add_argument("archivo", help="archivo fuente con la simulación")
+    parser.add_argument("--deltas", type=int, nargs="+", default=[-1, 1],
+                        help="cantidades a sumar a cada campo")
+    parser.add_argument("-j", "--procesos", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    with open(args.archivo, "r", encoding="utf-8") as f:
+        programa, diagnosticos = analizar(f.read())
+    if diagnosticos:
+        for d in diagnosticos:
+            print(f"{args.archivo}:{d}")
+        return 1
+    if len(programa.simulacion.config.luchadores) > 2:
+        print(f"{args.archivo}: la simulación es una batalla campal "
+              f"({' vs '.join(programa.simulacion.config.luchadores)}); "
+              "el análisis de sensibilidad solo admite combates de dos luchadores")
+        return 1
+
+    base, variantes, simulados, completos = sensibilidad(programa, args.deltas, args.procesos)
+    print(f"Combate base {base.luch1} vs {base.luch2}: {_describir(base)}\n")
+
+    margen = base.hp1 - base.hp2
+    variantes.sort(key=lambda v: (not v.usado, -abs(v.resultado.hp1 - v.resultado.hp2 - margen)))
+    for v in variantes:
+        p = v.parametro
+        campo = f"{p.luchador}.{p.nombre}.{p.campo}"
+        if not v.usado:
+            print(f"  {campo:<32} {v.original:>4} -> {v.valor:<4} sin efecto (nunca se usa)")
+            continue
+        cambio = " *" if v.resultado.ganador != base.ganador else ""
+        print(f"  {campo:<32} {v.original:>4} -> {v.valor:<4} {_describir(v.resultado)}{cambio}")
+    print(f"\n{len(variantes)} variantes, {simulados} pasos simulados "
+          f"({completos} repitiendo cada combate completo)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
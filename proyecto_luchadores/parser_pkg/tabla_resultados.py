@@ -0,0 +1,274 @@
+# ==============================================================
+#  parser_pkg/tabla_resultados.py
+# ==============================================================
+#  TABLA COLUMNAR DE RESULTADOS DE TORNEO
+# --------------------------------------------------------------
+#  Guarda la matriz N x N de un torneo en una carpeta con un
+#  archivo binario por columna, abiertos con mmap:
+#    meta.json     nombres de los luchadores
+#    estado.bin    int8  - 0 sin jugar, 1 gana la fila,
+#                          2 gana la columna, 3 empate
+#    margen.bin    int32 - HP fila - HP columna al terminar
+#    turnos.bin    int32 - turnos jugados
+#    resumen.bin   int32 - por luchador: victorias, empates,
+#                          derrotas y combates jugados
+#  La celda (i, j) es el combate en que i inicia contra j. Las
+#  consultas leen solo las páginas que necesitan, de modo que
+#  la tabla no tiene que caber en memoria.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m parser_pkg.tabla_resultados crear biblioteca.txt carpeta/
+#      python -m parser_pkg.tabla_resultados consultar carpeta/ --top 10
+#      python -m parser_pkg.tabla_resultados consultar carpeta/ --vs Ryu Ken
+#      python -m parser_pkg.tabla_resultados consultar carpeta/ --csv salida.csv
+# ==============================================================
+
+import argparse
+import csv
+import heapq
+import json
+import mmap
+import os
+import sys
+
+from parser_pkg.almacen_resultados import AlmacenResultados, torneo
+from parser_pkg.parseo_paralelo import analizar_paralelo
+
+SIN_JUGAR, GANA_FILA, GANA_COLUMNA, EMPATE = 0, 1, 2, 3
+
+# archivo -> (formato de memoryview, bytes por celda, celdas por luchador;
+#            None significa una celda por combate)
+COLUMNAS = {
+    "estado": ("b", 1, None),
+    "margen": ("i", 4, None),
+    "turnos": ("i", 4, None),
+    "resumen": ("i", 4, 4),
+}
+VICTORIAS, EMPATES, DERROTAS, JUGADOS = range(4)
+
+
+class TablaResultados:
+    """
+    Resultados de un torneo de N luchadores en formato columnar.
+    Usar TablaResultados.crear(...) o TablaResultados.abrir(...).
+    """
+    def __init__(self, ruta, nombres, escritura):
+        self.ruta = ruta
+        self.nombres = nombres
+        self.n = len(nombres)
+        self.indices = {nombre: i for i, nombre in enumerate(nombres)}
+        self._mapas = {}
+        self._vistas = {}
+        for nombre, (formato, _, _) in COLUMNAS.items():
+            with open(os.path.join(ruta, f"{nombre}.bin"), "r+b" if escritura else "rb") as f:
+                mapa = mmap.mmap(f.fileno(), 0,
+                                 access=mmap.ACCESS_WRITE if escritura else mmap.ACCESS_READ)
+            self._mapas[nombre] = mapa
+            self._vistas[nombre] = memoryview(mapa).cast(formato)
+        self.estado = self._vistas["estado"]
+        self.margen = self._vistas["margen"]
+        self.turnos = self._vistas["turnos"]
+        self.resumen = self._vistas["resumen"]
+
+    @classmethod
+    def crear(cls, ruta, nombres):
+        """Crea una tabla vacía (archivos dispersos llenos de ceros)."""
+        nombres = list(nombres)
+        n = len(nombres)
+        os.makedirs(ruta, exist_ok=True)
+        with open(os.path.join(ruta, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"nombres": nombres}, f, ensure_ascii=False)
+        for nombre, (_, tam, por_luchador) in COLUMNAS.items():
+            celdas = n * por_luchador if por_luchador else n * n
+            with open(os.path.join(ruta, f"{nombre}.bin"), "wb") as f:
+                f.truncate(max(celdas * tam, tam))
+        return cls(ruta, nombres, escritura=True)
+
+    @classmethod
+    def abrir(cls, ruta, escritura=False):
+        with open(os.path.join(ruta, "meta.json"), "r", encoding="utf-8") as f:
+            nombres = json.load(f)["nombres"]
+        return cls(ruta, nombres, escritura)
+
+    # ----------------------------------------------------------
+    # ESCRITURA
+    # ----------------------------------------------------------
+
+    def registrar(self, nombre1, nombre2, resultado):
+        """Guarda el Resultado del combate en que `nombre1` inicia contra `nombre2`."""
+        i, j = self.indices[nombre1], self.indices[nombre2]
+        celda = i * self.n + j
+        if self.estado[celda] != SIN_JUGAR:
+            self._contar(i, j, self.estado[celda], -1)
+        if resultado.hp1 > resultado.hp2:
+            estado = GANA_FILA
+        elif resultado.hp2 > resultado.hp1:
+            estado = GANA_COLUMNA
+        else:
+            estado = EMPATE
+        self.estado[celda] = estado
+        self.margen[celda] = resultado.hp1 - resultado.hp2
+        self.turnos[celda] = resultado.turnos
+        self._contar(i, j, estado, 1)
+
+    def registrar_lote(self, resultados):
+        """Guarda una lista de (nombre1, nombre2, Resultado), como la de torneo()."""
+        for nombre1, nombre2, resultado in resultados:
+            self.registrar(nombre1, nombre2, resultado)
+
+    def _contar(self, i, j, estado, signo):
+        r = self.resumen
+        if estado == GANA_FILA:
+            r[4 * i + VICTORIAS] += signo
+            r[4 * j + DERROTAS] += signo
+        elif estado == GANA_COLUMNA:
+            r[4 * i + DERROTAS] += signo
+            r[4 * j + VICTORIAS] += signo
+        else:
+            r[4 * i + EMPATES] += signo
+            r[4 * j + EMPATES] += signo
+        r[4 * i + JUGADOS] += signo
+        r[4 * j + JUGADOS] += signo
+
+    # ----------------------------------------------------------
+    # CONSULTAS
+    # ----------------------------------------------------------
+
+    def enfrentamiento(self, nombre1, nombre2):
+        """Devuelve (estado, margen, turnos) del combate en que `nombre1` inicia."""
+        celda = self.indices[nombre1] * self.n + self.indices[nombre2]
+        return self.estado[celda], self.margen[celda], self.turnos[celda]
+
+    def porcentaje_victorias(self, nombre):
+        """Victorias (empates cuentan medio) sobre combates jugados, entre 0 y 1."""
+        i = self.indices[nombre]
+        v, e, _, jugados = self.resumen[4 * i:4 * i + 4]
+        return (v + e / 2) / jugados if jugados else 0.0
+
+    def clasificacion(self):
+        """Lista [(nombre, porcentaje)] de mayor a menor porcentaje de victorias."""
+        return sorted(((n, self.porcentaje_victorias(n)) for n in self.nombres),
+                      key=lambda fila: (-fila[1], fila[0]))
+
+    def mejores_enfrentamientos(self, k=10):
+        """
+        Los k combates con mayor margen de HP a favor de quien inicia:
+        lista [(margen, nombre1, nombre2)]. Las filas cuyo máximo no
+        supera al peor de los k actuales se descartan sin recorrerlas.
+        """
+        if k <= 0:
+            return []
+        n = self.n
+        mejores = []   # montículo de mínimos con (margen, i, j)
+        for i in range(n):
+            fila = self.margen[i * n:(i + 1) * n]
+            if len(mejores) == k and max(fila) <= mejores[0][0]:
+                continue
+            estados = self.estado[i * n:(i + 1) * n]
+            for j, m in enumerate(fila):
+                if estados[j] == SIN_JUGAR:
+                    continue
+                if len(mejores) < k:
+                    heapq.heappush(mejores, (m, i, j))
+                elif m > mejores[0][0]:
+                    heapq.heapreplace(mejores, (m, i, j))
+        return [(m, self.nombres[i], self.nombres[j])
+                for m, i, j in sorted(mejores, reverse=True)]
+
+    def exportar_csv(self, ruta):
+        """Escribe un CSV con una fila por combate jugado, recorriendo fila a fila."""
+        textos = {GANA_FILA: "gana_luchador1", GANA_COLUMNA: "gana_luchador2", EMPATE: "empate"}
+        n = self.n
+        with open(ruta, "w", newline="", encoding="utf-8") as f:
+            escritor = csv.writer(f)
+            escritor.writerow(["luchador1", "luchador2", "resultado", "margen_hp", "turnos"])
+            for i in range(n):
+                estados = self.estado[i * n:(i + 1) * n]
+                margenes = self.margen[i * n:(i + 1) * n]
+                turnos = self.turnos[i * n:(i + 1) * n]
+                escritor.writerows(
+                    (self.nombres[i], self.nombres[j], textos[e], margenes[j], turnos[j])
+                    for j, e in enumerate(estados) if e != SIN_JUGAR)
+
+    def cerrar(self):
+        for nombre in ("estado", "margen", "turnos", "resumen"):
+            delattr(self, nombre)
+        for vista in self._vistas.values():
+            vista.release()
+        for mapa in self._mapas.values():
+            mapa.close()
+
+# --------------------------------------------------------------
+# LÍNEA DE COMANDOS
+# --------------------------------------------------------------
+
+def _crear(args):
+    with open(args.archivo, "r", encoding="utf-8") as f:
+        programa, diagnosticos = analizar_paralelo(f.read(), args.procesos)
+    if diagnosticos:
+        for d in diagnosticos:
+            print(f"{args.archivo}:{d}")
+        return 1
+    almacen = AlmacenResultados(args.db)
+    resultados, simulados = torneo(programa, almacen, args.procesos)
+    almacen.cerrar()
+
+    tabla = TablaResultados.crear(args.carpeta, programa.luchadores)
+    tabla.registrar_lote(resultados)
+    tabla.cerrar()
+    print(f"{len(resultados)} combates guardados en {args.carpeta} ({simulados} simulados)")
+    return 0
+
+
+def _consultar(args):
+    tabla = TablaResultados.abrir(args.carpeta)
+    if args.vs:
+        a, b = args.vs
+        desconocidos = [nombre for nombre in (a, b) if nombre not in tabla.indices]
+        if desconocidos:
+            print(f"Luchador desconocido en {args.carpeta}: {', '.join(desconocidos)}")
+            tabla.cerrar()
+            return 1
+        for n1, n2 in ((a, b), (b, a)):
+            estado, margen, turnos = tabla.enfrentamiento(n1, n2)
+            textos = {SIN_JUGAR: "sin jugar", GANA_FILA: f"gana {n1}",
+                      GANA_COLUMNA: f"gana {n2}", EMPATE: "empate"}
+            print(f"{n1} inicia vs {n2}: {textos[estado]}, margen {margen} HP, {turnos} turnos")
+    elif args.csv:
+        tabla.exportar_csv(args.csv)
+        print(f"CSV escrito en {args.csv}")
+    else:
+        print("Clasificación:")
+        for pos, (nombre, porcentaje) in enumerate(tabla.clasificacion()[:args.top], 1):
+            print(f"{pos:>4}. {nombre:<20} {porcentaje:6.1%}")
+        print("\nMayores márgenes:")
+        for margen, a, b in tabla.mejores_enfrentamientos(args.top):
+            print(f"  {a} vs {b}: +{margen} HP")
+    tabla.cerrar()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tabla columnar de resultados de torneo.")
+    sub = parser.add_subparsers(dest="orden", required=True)
+
+    crear = sub.add_parser("crear", help="simula el torneo y guarda la tabla")
+    crear.add_argument("archivo")
+    crear.add_argument("carpeta")
+    crear.add_argument("--db", default=":memory:",
+                       help="base SQLite para reutilizar combates ya simulados")
+    crear.add_argument("-j", "--procesos", type=int, default=1)
+
+    consultar = sub.add_parser("consultar", help="consulta una tabla ya creada")
+    consultar.add_argument("carpeta")
+    consultar.add_argument("--top", type=int, default=10)
+    consultar.add_argument("--vs", nargs=2, metavar=("LUCHADOR1", "LUCHADOR2"))
+    consultar.add_argument("--csv", help="exporta todos los combates a este CSV")
+
+    args = parser.parse_args(argv)
+    if args.orden == "consultar" and args.top < 0:
+        consultar.error("--top no puede ser negativo")
+    return _crear(args) if args.orden == "crear" else _consultar(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+# ==============================================================
+#  parser_pkg/validador.py
+# ==============================================================
+#  VALIDACIÓN MASIVA DE ARCHIVOS DE LUCHADORES
+# --------------------------------------------------------------
+#  Analiza uno o muchos archivos fuente y devuelve TODOS los
+#  errores léxicos y sintácticos de cada uno como objetos
+#  Diagnostico (línea, columna, mensaje), sin ejecutar combates.
+#   - El parser y el lexer se construyen una sola vez por proceso
+#     y se reutilizan para todos los archivos.
+#   - Con varios archivos se reparten en lotes entre un pool de
+#     procesos.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m parser_pkg.validador ejemplos/ otro.txt -j 4
+# ==============================================================
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from lexer.tokens import construir_lexer
+from parser_pkg.gramatica import Diagnostico
+from parser_pkg.interprete import analizar, construir_parser
+
+# --------------------------------------------------------------
+# PARSER COMPARTIDO POR PROCESO
+# --------------------------------------------------------------
+
+_parser = None
+_lexer = None
+
+def _preparar():
+    """Construye (una vez) el parser y el lexer de este proceso."""
+    global _parser, _lexer
+    if _parser is None:
+        _parser = construir_parser()
+        _lexer = construir_lexer()
+
+# --------------------------------------------------------------
+# API DE VALIDACIÓN
+# --------------------------------------------------------------
+
+def validar_texto(texto):
+    """Devuelve la lista de diagnósticos de un código fuente."""
+    _preparar()
+    _, diagnosticos = analizar(texto, _parser, _lexer)
+    return diagnosticos
+
+def validar_archivo(ruta):
+    """
+    Valida un archivo y devuelve (ruta, diagnosticos).
+    Un archivo ilegible se informa como un diagnóstico más.
+    """
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            texto = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return str(ruta), [Diagnostico('lectura', 0, 0, str(e))]
+    return str(ruta), validar_texto(texto)
+
+def _validar_lote(rutas):
+    return [validar_archivo(ruta) for ruta in rutas]
+
+def validar_archivos(rutas, procesos=None, tam_lote=64):
+    """
+    Valida muchos archivos en paralelo. Devuelve una lista de
+    (ruta, diagnosticos) en el mismo orden que `rutas`.
+    Con procesos=1 todo se hace en el proceso actual.
+    """
+    rutas = [str(r) for r in rutas]
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1 or len(rutas) <= tam_lote:
+        return _validar_lote(rutas)
+
+    lotes = [rutas[i:i + tam_lote] for i in range(0, len(rutas), tam_lote)]
+    resultados = []
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_preparar) as pool:
+        for parcial in pool.map(_validar_lote, lotes):
+            resultados.extend(parcial)
+    return resultados
+
+def expandir_rutas(entradas):
+    """Convierte archivos y carpetas en la lista de archivos .txt a validar."""
+    rutas = []
+    for entrada in entradas:
+        ruta = Path(entrada)
+        if ruta.is_dir():
+            rutas.extend(sorted(ruta.rglob("*.txt")))
+        else:
+            rutas.append(ruta)
+    return rutas
+
+# --------------------------------------------------------------
+# LÍNEA DE COMANDOS
+# --------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Valida archivos del lenguaje de luchadores.")
+    parser.add_argument("rutas", nargs="+", help="archivos o carpetas a validar")
+    parser.add_argument("-j", "--procesos", type=int, default=None,
+                        help="procesos en paralelo (por defecto, uno por núcleo)")
+    parser.add_argument("--json", action="store_true",
+                        help="imprime los diagnósticos en formato JSON")
+    args = parser.parse_args(argv)
+
+    rutas = expandir_rutas(args.rutas)
+    inicio = time.perf_counter()
+    resultados = validar_archivos(rutas, procesos=args.procesos)
+    duracion = time.perf_counter() - inicio
+
+    con_errores = [(ruta, diags) for ruta, diags in resultados if diags]
+    if args.json:
+        print(json.dumps({ruta: [d.a_dict() for d in diags]
+                          for ruta, diags in con_errores},
+                         ensure_ascii=False, indent=2))
+    else:
+        for ruta, diags in con_errores:
+            for d in diags:
+                print(f"{ruta}:{d}")
+        total = sum(len(diags) for _, diags in con_errores)
+        print(f"\n{len(resultados)} archivos, {len(con_errores)} con errores, "
+              f"{total} errores ({len(resultados) / max(duracion, 1e-9):.0f} archivos/s)",
+              file=sys.stderr)
+
+    return 1 if con_errores else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+# ==============================================================
+#  verificacion/aleatorios.py
+# ==============================================================
+#  LUCHADORES Y GUIONES ALEATORIOS
+# --------------------------------------------------------------
+#  Construye directamente los objetos del AST (sin pasar por el
+#  parser) con valores extremos que el generador de benchmarks
+#  no produce: HP/ST bajos, costos nulos, bloqueos, combos que
+#  usan otros combos o nombres inexistentes y condiciones
+#  anidadas. Las verificaciones comparan con ellos cada vía
+#  rápida contra el intérprete.
+# ==============================================================
+
+from parser_pkg.gramatica import AccionAtomica, Combo, Condicion, Luchador, SiSino, Usar
+
+OPERADORES = ('<', '<=', '>', '>=', '==', '!=')
+
+
+def luchador_aleatorio(nombre, azar):
+    """Luchador con 1-4 acciones y 0-3 combos (que solo usan combos anteriores)."""
+    luchador = Luchador(nombre, azar.randint(1, 200), azar.randint(0, 200))
+    for i in range(azar.randint(1, 4)):
+        accion = f"a{i}"
+        luchador.acciones[accion] = AccionAtomica(
+            azar.choice(["golpe", "patada", "bloqueo"]), accion,
+            azar.randint(0, 20), azar.choice([0, azar.randint(0, 25)]))
+    nombres = list(luchador.acciones)
+    for i in range(azar.randint(0, 3)):
+        combo = f"c{i}"
+        opciones = nombres + [f"c{j}" for j in range(i)] + ["nada"]
+        luchador.combos[combo] = Combo(combo, azar.randint(0, 40),
+                                       [azar.choice(opciones) for _ in range(azar.randint(1, 3))])
+    return luchador
+
+
+def guion_aleatorio(luchador, azar, condiciones=True, profundidad=0):
+    """
+    Lista de 1-3 instrucciones `usa` (a veces de un nombre que no
+    existe) y, con `condiciones`, bloques si/sino de hasta 3 niveles.
+    """
+    opciones = list(luchador.acciones) + list(luchador.combos) + ["zzz"]
+    guion = []
+    for _ in range(azar.randint(1, 3)):
+        if condiciones and profundidad < 3 and azar.random() < 0.4:
+            condicion = Condicion(azar.choice(['self', 'oponente']), azar.choice(['hp', 'st']),
+                                  azar.choice(OPERADORES), azar.randint(0, 150))
+            sino = (guion_aleatorio(luchador, azar, condiciones, profundidad + 1)
+                    if azar.random() < 0.6 else [])
+            guion.append(SiSino(condicion,
+                                guion_aleatorio(luchador, azar, condiciones, profundidad + 1),
+                                sino))
+        else:
+            guion.append(Usar(azar.choice(opciones)))
+    return guion
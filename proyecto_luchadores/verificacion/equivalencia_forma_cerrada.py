@@ -0,0 +1,50 @@
+# ==============================================================
+#  verificacion/equivalencia_forma_cerrada.py
+# ==============================================================
+#  Comprueba que forma_cerrada.resolver devuelve exactamente el
+#  mismo Resultado (HP, ST y turnos de ambos) que el intérprete
+#  motor_combate.pelear en combates aleatorios: guiones solo de
+#  `usa` (vía rápida) y, en una parte de los casos, con
+#  condiciones (donde resolver debe recurrir al intérprete).
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m verificacion.equivalencia_forma_cerrada --casos 80000
+# ==============================================================
+
+import argparse
+import random
+import sys
+
+from parser_pkg.forma_cerrada import es_aplicable, resolver
+from parser_pkg.motor_combate import pelear
+from verificacion.aleatorios import guion_aleatorio, luchador_aleatorio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--casos", type=int, default=20000)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    azar = random.Random(args.semilla)
+    rapidos = 0
+    for caso in range(args.casos):
+        a, b = luchador_aleatorio("A", azar), luchador_aleatorio("B", azar)
+        condiciones = azar.random() < 0.2
+        turnos = {"A": guion_aleatorio(a, azar, condiciones),
+                  "B": guion_aleatorio(b, azar, condiciones)}
+        inicia = azar.choice("AB")
+        turnos_max = azar.choice([0, 1, 3, 10, 50, 1000])
+
+        esperado = pelear(a.clonar(), b.clonar(), turnos, inicia, turnos_max)
+        obtenido = resolver(a.clonar(), b.clonar(), turnos, inicia, turnos_max)
+        if obtenido != esperado:
+            print(f"Caso {caso}: pelear={esperado!r} resolver={obtenido!r}")
+            return 1
+        rapidos += es_aplicable(a, b, turnos, inicia)
+
+    print(f"{args.casos} combates idénticos ({rapidos} por la vía rápida)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
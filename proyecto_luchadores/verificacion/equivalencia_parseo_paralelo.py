@@ -0,0 +1,94 @@
+# ==============================================================
+#  verificacion/equivalencia_parseo_paralelo.py
+# ==============================================================
+#  Comprueba que parseo_paralelo.analizar_paralelo da el mismo
+#  resultado que interprete.analizar: los mismos diagnósticos
+#  (tipo, línea, columna y mensaje) y, sin errores, un Programa
+#  que se formatea igual. Se prueban bibliotecas generadas, con
+#  errores introducidos al azar (también justo antes de una '}',
+#  al final de las acciones, los combos o un turno, y tokens
+#  borrados, repetidos o reemplazados, llaves incluidas), con
+#  luchadores repetidos, con comentarios que contienen llaves y
+#  con bloques en una misma línea. Un tamaño mínimo de fragmento
+#  pequeño obliga a repartir incluso las bibliotecas chicas.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m verificacion.equivalencia_parseo_paralelo --casos 40
+# ==============================================================
+
+import argparse
+import random
+import re
+import sys
+
+from benchmarks.generador import generar_programa, introducir_errores
+from parser_pkg.formateador import formatear_programa
+from parser_pkg.interprete import analizar
+from parser_pkg.parseo_paralelo import analizar_paralelo
+
+_TOKEN = re.compile(r"\w+|[^\s\w]")
+_REEMPLAZOS = [";", "}", "{", ",", "(", ")", "5", "x", "usa"]
+
+
+def comparar(texto, procesos):
+    """Devuelve None si ambos análisis coinciden o una descripción de la diferencia."""
+    esperado, diag_esperados = analizar(texto)
+    obtenido, diag_obtenidos = analizar_paralelo(texto, procesos, tam_minimo=200)
+    esperados = [str(d) for d in diag_esperados]
+    obtenidos = [str(d) for d in diag_obtenidos]
+    if esperados != obtenidos:
+        return f"diagnósticos {esperados[:3]} != {obtenidos[:3]}"
+    if (esperado is None) != (obtenido is None):
+        return "solo uno de los análisis devolvió un programa"
+    if esperado is not None and formatear_programa(esperado) != formatear_programa(obtenido):
+        return "los programas no coinciden"
+    return None
+
+
+def editar_tokens(texto, azar, cantidad):
+    """Borra, repite o reemplaza `cantidad` tokens elegidos al azar."""
+    tokens = list(_TOKEN.finditer(texto))
+    for marca in sorted(azar.sample(tokens, cantidad), key=lambda m: -m.start()):
+        token = marca.group()
+        nuevo = azar.choice(["", f"{token} {token}", azar.choice(_REEMPLAZOS)])
+        texto = texto[:marca.start()] + nuevo + texto[marca.end():]
+    return texto
+
+
+def variantes(azar, n_luchadores):
+    """Genera textos de prueba a partir de una biblioteca aleatoria."""
+    texto = generar_programa(n_luchadores, azar.randrange(1 << 30))
+    yield texto
+    yield introducir_errores(texto, azar, azar.randint(1, 4))
+    yield introducir_errores(texto, azar, azar.randint(2, 4), antes_de_llave=True)
+    yield editar_tokens(texto, azar, 3)
+    a, b = azar.sample(range(n_luchadores), 2)
+    # Nombre repetido, comentario con llaves y dos bloques en la misma línea
+    yield texto.replace(f"luchador Luchador{a} {{", f"luchador Luchador{b} {{", 1)
+    yield texto.replace(f"}}\n\nluchador Luchador{a} ", f"}} // {{ raro }}\n  luchador Luchador{a} ", 1)
+    yield texto.replace(f"}}\n\nluchador Luchador{b} ", f"}}   luchador Luchador{b} ", 1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--casos", type=int, default=40)
+    parser.add_argument("--luchadores", type=int, default=60)
+    parser.add_argument("-j", "--procesos", type=int, default=4)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    azar = random.Random(args.semilla)
+    comparados = 0
+    for caso in range(args.casos):
+        for texto in variantes(azar, args.luchadores):
+            diferencia = comparar(texto, args.procesos)
+            if diferencia is not None:
+                print(f"Caso {caso}: {diferencia}")
+                return 1
+            comparados += 1
+
+    print(f"{comparados} textos analizados igual en secuencial y en paralelo")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+# ==============================================================
+#  verificacion/equivalencia_paso_a_paso.py
+# ==============================================================
+#  Comprueba que PeleaPasoAPaso reproduce exactamente a
+#  motor_combate.pelear en combates aleatorios con condiciones:
+#   - avanzando con paso() y turno() mezclados al azar hasta el
+#     final, el Resultado (HP, ST y turnos) es el mismo;
+#   - tras restore() de una foto cualquiera tomada por el camino,
+#     terminar() llega otra vez al mismo Resultado.
+#  También cubre turnos_max 0, quien no tiene guion y un `inicia`
+#  que no es ninguno de los dos luchadores.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m verificacion.equivalencia_paso_a_paso --casos 2000
+# ==============================================================
+
+import argparse
+import random
+import sys
+
+from parser_pkg.motor_combate import pelear
+from parser_pkg.paso_a_paso import PeleaPasoAPaso
+from verificacion.aleatorios import guion_aleatorio, luchador_aleatorio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--casos", type=int, default=2000,
+                        help="grupos de 5 luchadores (25 combates cada uno)")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    azar = random.Random(args.semilla)
+    combates = 0
+    for caso in range(args.casos):
+        luchadores = {f"L{i}": luchador_aleatorio(f"L{i}", azar) for i in range(5)}
+        turnos = {nombre: guion_aleatorio(l, azar)
+                  for nombre, l in luchadores.items() if azar.random() < 0.8}
+        for a in luchadores:
+            for b in luchadores:
+                turnos_max = azar.choice([0, 1, 5, 30])
+                inicia = azar.choice([a, b, a, b, "X"])
+                esperado = pelear(luchadores[a].clonar(), luchadores[b].clonar(),
+                                  turnos, inicia, turnos_max)
+
+                pelea = PeleaPasoAPaso(luchadores[a], luchadores[b], turnos, inicia, turnos_max)
+                fotos = []
+                while not pelea.terminado:
+                    fotos.append(pelea.snapshot())
+                    if azar.random() < 0.3:
+                        pelea.turno()
+                    else:
+                        pelea.paso()
+                obtenido = pelea.resultado()
+                if obtenido != esperado:
+                    print(f"Caso {caso} ({a} vs {b}): pelear={esperado!r} paso a paso={obtenido!r}")
+                    return 1
+                if fotos:
+                    pelea.restore(azar.choice(fotos))
+                    obtenido = pelea.terminar()
+                    if obtenido != esperado:
+                        print(f"Caso {caso} ({a} vs {b}): tras restore {obtenido!r} != {esperado!r}")
+                        return 1
+                combates += 1
+
+    print(f"{combates} combates idénticos a motor_combate.pelear")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+# ==============================================================
+#  verificacion/equivalencia_sensibilidad.py
+# ==============================================================
+#  Comprueba que sensibilidad.sensibilidad, que arranca cada
+#  variante desde una foto del combate base, da el mismo
+#  Resultado que repetir el combate completo con el campo
+#  cambiado (balanceador.aplicar_parametros + pelear). Se usan
+#  los ejemplos de dos luchadores y programas aleatorios con
+#  condiciones, con uno y con dos procesos.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m verificacion.equivalencia_sensibilidad --casos 2000
+# ==============================================================
+
+import argparse
+import glob
+import random
+import sys
+
+from parser_pkg.balanceador import aplicar_parametros
+from parser_pkg.gramatica import Configuracion, Programa, Simulacion, Turno
+from parser_pkg.interprete import analizar
+from parser_pkg.motor_combate import pelear
+from parser_pkg.sensibilidad import sensibilidad
+from verificacion.aleatorios import guion_aleatorio, luchador_aleatorio
+
+DELTAS = (-3, -1, 1, 5)
+
+
+def combate_completo(programa):
+    """El combate de la simulación repetido desde el principio."""
+    config = programa.simulacion.config
+    turnos = {t.luchador: t.acciones for t in programa.simulacion.turnos}
+    return pelear(programa.luchadores[config.luch1].clonar(),
+                  programa.luchadores[config.luch2].clonar(),
+                  turnos, config.inicia, config.turnos)
+
+
+def comparar(programa, procesos):
+    """Devuelve None si todas las variantes coinciden o una descripción de la diferencia."""
+    base, variantes, _, _ = sensibilidad(programa, DELTAS, procesos)
+    if base != combate_completo(programa):
+        return f"combate base {base!r}"
+    for v in variantes:
+        esperado = combate_completo(aplicar_parametros(programa, [v.parametro], [v.valor]))
+        if v.resultado != esperado:
+            return f"{v!r} != {esperado!r}"
+    return None
+
+
+def programa_aleatorio(azar):
+    luchadores = {n: luchador_aleatorio(n, azar) for n in ("L0", "L1")}
+    turnos = [Turno(n, guion_aleatorio(l, azar)) for n, l in luchadores.items()
+              if azar.random() < 0.9]
+    config = Configuracion("L0", "L1", azar.choice(["L0", "L1"]), azar.choice([1, 5, 30]))
+    return Programa(luchadores, Simulacion(config, turnos))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--casos", type=int, default=2000)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    programas = []
+    for ruta in sorted(glob.glob("ejemplos/*.txt")):
+        with open(ruta, "r", encoding="utf-8") as f:
+            programa, diagnosticos = analizar(f.read())
+        if not diagnosticos and len(programa.simulacion.config.luchadores) == 2:
+            programas.append((ruta, programa))
+    azar = random.Random(args.semilla)
+    programas += [(f"aleatorio {i}", programa_aleatorio(azar)) for i in range(args.casos)]
+
+    for nombre, programa in programas:
+        for procesos in ((1, 2) if nombre.startswith("ejemplos") else (1,)):
+            diferencia = comparar(programa, procesos)
+            if diferencia is not None:
+                print(f"{nombre} (-j {procesos}): {diferencia}")
+                return 1
+
+    print(f"{len(programas)} programas: todas las variantes coinciden con el combate completo")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
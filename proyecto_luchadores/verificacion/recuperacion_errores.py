@@ -0,0 +1,84 @@
+# ==============================================================
+#  verificacion/recuperacion_errores.py
+# ==============================================================
+#  Comprueba que el validador informa todos los errores de un
+#  archivo aunque uno de ellos quede justo antes de una '}' (la
+#  última acción sin ';', un combo roto, un turno o un bloque
+#  si/sino sin cerrar bien): el parser debe recuperarse en esa
+#  llave y seguir encontrando los errores de los bloques
+#  siguientes. Cada caso indica las posiciones (línea, columna)
+#  esperadas.
+# --------------------------------------------------------------
+#  Forma de ejecución (desde proyecto_luchadores/):
+#      python -m verificacion.recuperacion_errores
+# ==============================================================
+
+import sys
+
+from parser_pkg.validador import validar_texto
+
+GOLPE = "golpe: p(daño=5, costo=2, altura=media, forma=frontal, giratoria=no);"
+
+
+def luchador(nombre, stats="stats(hp=100, st=50);",
+             acciones=GOLPE + "\n    bloqueo: b;", combos="C(st_req=10) { p }"):
+    """Código de un luchador de 10 líneas (más una en blanco) con las partes dadas."""
+    return (f"luchador {nombre} {{\n  {stats}\n  acciones {{\n    {acciones}\n  }}\n"
+            f"  combos {{\n    {combos}\n  }}\n}}\n\n")
+
+
+def simulacion(pelea="turno A { usa p; }"):
+    return ("simulacion {\n  config { luchadores: A vs B; inicia: A; turnos_max: 3; }\n"
+            f"  pelea {{\n    {pelea}\n  }}\n}}\n")
+
+
+CASOS = [
+    ("última acción sin ';' antes de la '}'",
+     luchador("A", acciones=GOLPE + "\n    bloqueo: b")
+     + luchador("B", acciones=GOLPE.replace("daño=5", "daño="))
+     + luchador("C", stats="stats(hp=100 st=50);") + simulacion(),
+     [(6, 3), (15, 19), (23, 16)]),
+    ("única acción sin ';'",
+     luchador("A", acciones="bloqueo: b") + luchador("B", stats="stats(hp=, st=50);")
+     + simulacion(),
+     [(5, 3), (12, 12)]),
+    ("error dentro de un combo",
+     luchador("A", combos="C(st_req=10) { p q }") + luchador("B", stats="stats(hp=1 st=2);")
+     + simulacion(),
+     [(8, 22), (13, 14)]),
+    ("token suelto después de un combo completo",
+     luchador("A", combos="C(st_req=10) { p } 5") + luchador("B", stats="stats(hp=1 st=2);")
+     + simulacion(),
+     [(8, 24), (13, 14)]),
+    ("combo sin cabecera",
+     luchador("A", combos="X }") + luchador("B", stats="stats(hp=1 st=2);") + simulacion(),
+     [(8, 7), (13, 14)]),
+    ("luchador sin stats",
+     luchador("A", stats="") + luchador("B", stats="stats(hp=1 st=2);") + simulacion(),
+     [(3, 3), (13, 14)]),
+    ("última instrucción de un turno sin ';'",
+     luchador("A") + luchador("B")
+     + simulacion("turno A { usa p }\n    turno B { usa ; }\n    turno A { usa p; usa 3; }"),
+     [(26, 21), (27, 19), (28, 26)]),
+    ("error al final de un bloque si/sino",
+     luchador("A") + luchador("B")
+     + simulacion("turno A { si (self.hp > 3) { usa p } sino { usa 4; } usa q; }\n"
+                  "    turno B { usa p; usa ; }"),
+     [(26, 40), (26, 53), (27, 26)]),
+]
+
+
+def main():
+    fallidos = 0
+    for descripcion, texto, esperadas in CASOS:
+        obtenidas = [(d.linea, d.columna) for d in validar_texto(texto)]
+        if obtenidas != esperadas:
+            print(f"{descripcion}: se esperaban {esperadas} y se obtuvo {obtenidas}")
+            fallidos += 1
+    if fallidos:
+        return 1
+    print(f"{len(CASOS)} casos con todos los errores informados")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())